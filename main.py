@@ -7,28 +7,30 @@ This script collects data from Zendesk via REST API and exports it as organized
 import sys
 import os
 import click
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
 from src.data_collectors.tickets import TicketsCollector
 from src.data_collectors.users import UsersCollector
 from src.data_collectors.organizations import OrganizationsCollector
 from src.data_collectors.knowledge_base import KnowledgeBaseCollector
 from src.data_collectors.macros import MacrosCollector, GroupsCollector
+from src.data_collectors._user_fetch import clear_caches
+from src.data_collectors._resource_cache import clear_resource_caches
 from src.utils.config import config
-from rich.console import Console
+from src.utils.console import console
 from rich.table import Table
 from rich.panel import Panel
 
 
-console = Console()
-
-
 def print_banner():
     """Print application banner."""
     banner = """
@@ -48,7 +50,7 @@ def test_connection() -> bool:
         True if connection successful, False otherwise
     """
     try:
-        client = ZendeskClient()
+        client = get_client()
         success, message = client.test_connection()
         
         if success:
@@ -85,6 +87,34 @@ def parse_date_range(date_range: Optional[str]) -> Optional[Tuple[str, str]]:
         return None
 
 
+def run_collector(collector, collect_kwargs: Dict[str, Any],
+                  on_collected: Optional[Callable[[Any], None]] = None) -> Optional[Dict[str, Any]]:
+    """Collect and export a single data category.
+    
+    Args:
+        collector: Collector instance
+        collect_kwargs: Keyword arguments for the collector's collect_all
+        on_collected: Called with the collected data (None if collection failed)
+        
+    Returns:
+        Statistics dictionary, or None if no data was found
+    """
+    data = None
+    try:
+        data = collector.collect_all(**collect_kwargs)
+    finally:
+        if on_collected is not None:
+            on_collected(data)
+    
+    # Knowledge base returns a dict of lists that is never empty itself
+    has_data = any(data.values()) if isinstance(data, dict) else bool(data)
+    if not has_data:
+        return None
+    
+    collector.export_to_markdown(data)
+    return collector.get_statistics(data)
+
+
 @click.group()
 @click.option('--config-file', '-c', help='Path to configuration file')
 def cli(config_file):
@@ -192,8 +222,9 @@ def organizations(output_dir):
 
 
 @cli.command(name='knowledge-base')
+@click.option('--no-authors', is_flag=True, help='Skip article author lookups')
 @click.option('--output-dir', help='Custom output directory')
-def knowledge_base(output_dir):
+def knowledge_base(no_authors, output_dir):
     """Collect and export knowledge base articles."""
     console.print("📚 Starting knowledge base collection...", style="bold blue")
     
@@ -201,7 +232,7 @@ def knowledge_base(output_dir):
         collector = KnowledgeBaseCollector()
         
         # Collect knowledge base data
-        kb_data = collector.collect_all()
+        kb_data = collector.collect_all(include_authors=not no_authors)
         
         if any(kb_data.values()):
             # Export to markdown
@@ -295,65 +326,74 @@ def all(status, date_range, no_comments, user_role, active_macros_only,
     all_stats = {}
     
     try:
-        # 1. Collect Tickets
-        console.print("\n1️⃣ Collecting Tickets", style="bold yellow")
-        tickets_collector = TicketsCollector()
-        tickets_data = tickets_collector.collect_all(
-            status_filter=status,
-            date_range=parsed_date_range,
-            include_comments=not no_comments
-        )
-        if tickets_data:
-            tickets_collector.export_to_markdown(tickets_data)
-            all_stats['Tickets'] = tickets_collector.get_statistics(tickets_data)
+        tickets_collector = TicketsCollector(show_progress=False)
+        users_collector = UsersCollector(show_progress=False)
+        tickets_hooks = {}
         
-        # 2. Collect Users
-        console.print("\n2️⃣ Collecting Users", style="bold yellow")
-        users_collector = UsersCollector()
-        users_data = users_collector.collect_all(role_filter=user_role)
-        if users_data:
-            users_collector.export_to_markdown(users_data)
-            all_stats['Users'] = users_collector.get_statistics(users_data)
-        
-        # 3. Collect Organizations
-        console.print("\n3️⃣ Collecting Organizations", style="bold yellow")
-        orgs_collector = OrganizationsCollector()
-        orgs_data = orgs_collector.collect_all()
-        if orgs_data:
-            orgs_collector.export_to_markdown(orgs_data)
-            all_stats['Organizations'] = orgs_collector.get_statistics(orgs_data)
+        # Unfiltered tickets cover every user, so per-user ticket counts are tallied
+        # from them instead of running searches for each user
+        if not status and not parsed_date_range:
+            tickets_collected = threading.Event()
+            
+            def prime_user_statistics(tickets_by_status):
+                try:
+                    if tickets_by_status:
+                        users_collector.prime_stats_from_tickets(
+                            chain.from_iterable(tickets_by_status.values())
+                        )
+                finally:
+                    tickets_collected.set()
+            
+            tickets_hooks['on_collected'] = prime_user_statistics
+            # Users are fetched alongside tickets and only wait for the tallies to fill in statistics
+            users_collector.stats_ready = tickets_collected
         
-        # 4. Collect Knowledge Base
-        console.print("\n4️⃣ Collecting Knowledge Base", style="bold yellow")
-        kb_collector = KnowledgeBaseCollector()
-        kb_data = kb_collector.collect_all()
-        if any(kb_data.values()):
-            kb_collector.export_to_markdown(kb_data)
-            all_stats['Knowledge Base'] = kb_collector.get_statistics(kb_data)
+        # Each collector is independent and network-bound, so run them concurrently.
+        # Per-collector progress bars are disabled since Rich allows only one live display.
+        jobs = [
+            ('Tickets', tickets_collector, {
+                'status_filter': status,
+                'date_range': parsed_date_range,
+                'include_comments': not no_comments
+            }, tickets_hooks),
+            ('Users', users_collector, {'role_filter': user_role}, {}),
+            ('Organizations', OrganizationsCollector(show_progress=False), {}, {}),
+            ('Knowledge Base', KnowledgeBaseCollector(show_progress=False), {}, {}),
+            ('Macros', MacrosCollector(show_progress=False), {'active_only': active_macros_only}, {}),
+            ('Groups', GroupsCollector(show_progress=False), {'include_deleted': include_deleted_groups}, {}),
+        ]
         
-        # 5. Collect Macros
-        console.print("\n5️⃣ Collecting Macros", style="bold yellow")
-        macros_collector = MacrosCollector()
-        macros_data = macros_collector.collect_all(active_only=active_macros_only)
-        if macros_data:
-            macros_collector.export_to_markdown(macros_data)
-            all_stats['Macros'] = macros_collector.get_statistics(macros_data)
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {}
+            for name, collector, collect_kwargs, hooks in jobs:
+                console.print(f"▶️  Collecting {name}", style="bold yellow")
+                futures[executor.submit(run_collector, collector, collect_kwargs, **hooks)] = name
+            
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    stats = future.result()
+                except Exception as e:
+                    console.print(f"❌ Error collecting {name}: {e}", style="bold red")
+                    continue
+                
+                if stats is not None:
+                    all_stats[name] = stats
+                console.print(f"✅ Finished {name}", style="bold green")
         
-        # 6. Collect Groups
-        console.print("\n6️⃣ Collecting Groups", style="bold yellow")
-        groups_collector = GroupsCollector()
-        groups_data = groups_collector.collect_all(include_deleted=include_deleted_groups)
-        if groups_data:
-            groups_collector.export_to_markdown(groups_data)
-            all_stats['Groups'] = groups_collector.get_statistics(groups_data)
+        # Collected records are exported, so the shared lookups are no longer needed
+        clear_caches()
+        clear_resource_caches()
         
         # Display summary
         console.print("\n" + "="*60, style="bold cyan")
         console.print("📊 COLLECTION SUMMARY", style="bold cyan")
         console.print("="*60, style="bold cyan")
         
-        for category, stats in all_stats.items():
-            display_statistics(category, stats)
+        # Keep the summary in collection order regardless of completion order
+        for name, *_ in jobs:
+            if name in all_stats:
+                display_statistics(name, all_stats[name])
         
         console.print("\n🎉 Complete data collection finished!", style="bold green")
         console.print(f"📁 All files saved to: {config.get_output_config()['base_directory']}", style="green")
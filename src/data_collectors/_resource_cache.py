@@ -0,0 +1,198 @@
+"""Organization, group and ticket field lookups shared by the collectors."""
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.utils.config import config
+from src.utils.disk_cache import DiskCache
+
+
+logger = logging.getLogger(__name__)
+
+# Keyed by ID; collectors that run in the same process resolve each record once
+organizations_cache: Dict[int, Dict[str, Any]] = {}
+groups_cache: Dict[int, Dict[str, Any]] = {}
+ticket_fields_cache: Dict[int, Dict[str, Any]] = {}
+
+# kind -> (in-memory cache, single-record endpoint, response key, show_many endpoint, show_many key)
+_RESOURCES = {
+    'organizations': (organizations_cache, '/organizations/{}.json', 'organization',
+                      '/organizations/show_many.json', 'organizations'),
+    'groups': (groups_cache, '/groups/{}.json', 'group', '/groups/show_many.json', 'groups'),
+}
+
+# Records persisted across runs, one store per kind, opened on first use
+_stores: Dict[str, DiskCache] = {}
+_stores_lock = threading.Lock()
+
+# The whole ticket field catalog is persisted under a single key
+_TICKET_FIELDS_KEY = 'all'
+_ticket_fields_loaded = False
+_ticket_fields_lock = threading.Lock()
+
+
+def _get_store(kind: str) -> DiskCache:
+    """Get the persistent cache for a kind of record, opening it on first use.
+
+    Args:
+        kind: Record kind ('organizations', 'groups' or 'ticket_fields')
+
+    Returns:
+        Disk cache keyed by record ID
+    """
+    with _stores_lock:
+        store = _stores.get(kind)
+        if store is None:
+            cache_config = config.get_cache_config()
+            store = DiskCache(
+                Path(cache_config['directory']) / f'{kind}.sqlite',
+                ttl_seconds=cache_config['ttl_days'] * 86400
+            )
+            _stores[kind] = store
+        return store
+
+
+def get_resource(client: ZendeskClient, kind: str, resource_id: Optional[int]) -> Dict[str, Any]:
+    """Get an organization or group with caching.
+
+    Args:
+        client: Zendesk client
+        kind: 'organizations' or 'groups'
+        resource_id: Record ID
+
+    Returns:
+        Record dictionary (empty if it can't be found)
+    """
+    if not resource_id:
+        return {}
+
+    cache, endpoint, data_key, _, _ = _RESOURCES[kind]
+    resource = cache.get(resource_id)
+    if resource is None:
+        store = _get_store(kind)
+        resource = store.get(resource_id)
+        if resource is None:
+            try:
+                response = client.get(endpoint.format(resource_id))
+                resource = response.get(data_key, {})
+                if resource:
+                    store.set(resource_id, resource)
+            except ZendeskAPIError as e:
+                # Only a missing record is a definitive empty answer; anything else must not be cached
+                if e.status_code != 404:
+                    logger.warning("Failed to fetch %s %s: %s", kind, resource_id, e)
+                    return {}
+                resource = {}
+        cache[resource_id] = resource
+
+    return resource
+
+
+def prefetch_resources(client: ZendeskClient, kind: str, resource_ids: Iterable[Optional[int]]):
+    """Fetch organizations or groups in batches and populate the shared cache.
+
+    Records fetched by a previous run are read from disk while still within the TTL.
+
+    Args:
+        client: Zendesk client
+        kind: 'organizations' or 'groups'
+        resource_ids: Record IDs to resolve (falsy and cached IDs are skipped)
+    """
+    cache, _, _, many_endpoint, many_key = _RESOURCES[kind]
+    missing_ids = {resource_id for resource_id in resource_ids if resource_id and resource_id not in cache}
+    if not missing_ids:
+        return
+
+    store = _get_store(kind)
+    for resource_id, resource in store.get_many(missing_ids).items():
+        cache[int(resource_id)] = resource
+    missing_ids = sorted(resource_id for resource_id in missing_ids if resource_id not in cache)
+    if not missing_ids:
+        return
+
+    try:
+        resources = client.get_many(many_endpoint, many_key, missing_ids)
+    except ZendeskAPIError:
+        # Leave the cache untouched so lookups fall back to single requests
+        return
+
+    for resource in resources:
+        cache[resource['id']] = resource
+    store.set_many((resource['id'], resource) for resource in resources)
+
+    # IDs not returned would fail individually as well
+    for resource_id in missing_ids:
+        cache.setdefault(resource_id, {})
+
+
+def cache_resources(kind: str, resources: Iterable[Dict[str, Any]]):
+    """Add already-fetched organizations or groups to the shared and persistent caches.
+
+    Args:
+        kind: 'organizations' or 'groups'
+        resources: Records (e.g., sideloaded with a page of tickets)
+    """
+    resources = list(resources)
+    if not resources:
+        return
+
+    cache = _RESOURCES[kind][0]
+    for resource in resources:
+        cache[resource['id']] = resource
+    _get_store(kind).set_many((resource['id'], resource) for resource in resources)
+
+
+def load_ticket_fields(client: ZendeskClient) -> Dict[int, Dict[str, Any]]:
+    """Load every ticket field definition once; the catalog is small and account-wide.
+
+    Args:
+        client: Zendesk client
+
+    Returns:
+        Ticket fields keyed by ID (missing fields fall back to a generic title)
+    """
+    global _ticket_fields_loaded
+
+    if _ticket_fields_loaded:
+        return ticket_fields_cache
+
+    # Concurrent collectors wait for one load instead of seeing a half-filled catalog
+    with _ticket_fields_lock:
+        if _ticket_fields_loaded:
+            return ticket_fields_cache
+
+        store = _get_store('ticket_fields')
+        fields = store.get(_TICKET_FIELDS_KEY)
+        if fields is None:
+            try:
+                fields = list(client.get_ticket_fields())
+            except ZendeskAPIError as e:
+                # Not retried for every ticket; field titles fall back to a generic one for this run
+                logger.warning("Failed to load ticket fields: %s", e)
+                _ticket_fields_loaded = True
+                return ticket_fields_cache
+            store.set(_TICKET_FIELDS_KEY, fields)
+
+        for field in fields:
+            ticket_fields_cache[field['id']] = field
+        _ticket_fields_loaded = True
+
+    return ticket_fields_cache
+
+
+def clear_resource_caches():
+    """Drop all cached organizations, groups and ticket fields and close the persistent caches."""
+    global _ticket_fields_loaded
+
+    organizations_cache.clear()
+    groups_cache.clear()
+    with _ticket_fields_lock:
+        ticket_fields_cache.clear()
+        _ticket_fields_loaded = False
+
+    with _stores_lock:
+        for store in _stores.values():
+            store.close()
+        _stores.clear()
@@ -0,0 +1,128 @@
+"""User lookups shared by the collectors."""
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.utils.config import config
+from src.utils.disk_cache import DiskCache
+from src.utils.lru import LRUCache
+
+
+logger = logging.getLogger(__name__)
+
+# Users keyed by ID, shared across collectors and bounded so large tenants don't grow it forever
+_users_cache = LRUCache(maxsize=65536)
+
+# Users persisted across runs, opened on first use
+_user_store: Optional[DiskCache] = None
+_user_store_lock = threading.Lock()
+
+
+def get_user_store() -> DiskCache:
+    """Get the persistent user cache, opening it on first use.
+
+    Returns:
+        Disk cache of users keyed by user ID
+    """
+    global _user_store
+
+    with _user_store_lock:
+        if _user_store is None:
+            cache_config = config.get_cache_config()
+            _user_store = DiskCache(
+                Path(cache_config['directory']) / 'users.sqlite',
+                ttl_seconds=cache_config['ttl_days'] * 86400
+            )
+        return _user_store
+
+
+def get_user_info(client: ZendeskClient, user_id: Optional[int]) -> Dict[str, Any]:
+    """Get user information with caching.
+
+    Args:
+        client: Zendesk client
+        user_id: User ID
+
+    Returns:
+        User information dictionary
+    """
+    if not user_id:
+        return {}
+
+    user = _users_cache.get(user_id)
+    if user is None:
+        user_store = get_user_store()
+        user = user_store.get(user_id)
+        if user is None:
+            try:
+                response = client.get(f'/users/{user_id}.json')
+                user = response.get('user', {})
+                if user:
+                    user_store.set(user_id, user)
+            except ZendeskAPIError as e:
+                # Only a missing user is a definitive empty answer; anything else must not be cached
+                if e.status_code != 404:
+                    logger.warning("Failed to fetch user %s: %s", user_id, e)
+                    return {}
+                user = {}
+        _users_cache.set(user_id, user)
+
+    return user
+
+
+def prefetch_users(client: ZendeskClient, user_ids: Iterable[int]):
+    """Fetch users in batches and populate the shared cache.
+
+    Users fetched by a previous run are read from disk while still within the TTL.
+
+    Args:
+        client: Zendesk client
+        user_ids: User IDs to resolve
+    """
+    missing_ids = {user_id for user_id in user_ids if user_id and user_id not in _users_cache}
+    if not missing_ids:
+        return
+
+    for user_id, user in get_user_store().get_many(missing_ids).items():
+        _users_cache.set(int(user_id), user)
+    missing_ids = {user_id for user_id in missing_ids if user_id not in _users_cache}
+    if not missing_ids:
+        return
+
+    try:
+        users = client.get_users_by_ids(sorted(missing_ids))
+    except ZendeskAPIError:
+        # Leave the cache untouched so get_user_info falls back to single lookups
+        return
+
+    cache_users(users)
+
+    # Users not returned (e.g., deleted users) would fail individually as well
+    for user_id in missing_ids:
+        if user_id not in _users_cache:
+            _users_cache.set(user_id, {})
+
+
+def cache_users(users: Iterable[Dict[str, Any]]):
+    """Add already-fetched users to the shared and persistent caches.
+
+    Args:
+        users: User records
+    """
+    users = list(users)
+    for user in users:
+        _users_cache.set(user['id'], user)
+    get_user_store().set_many((user['id'], user) for user in users)
+
+
+def clear_caches():
+    """Drop all cached users and close the persistent cache at the end of a run."""
+    global _user_store
+
+    _users_cache.clear()
+    with _user_store_lock:
+        if _user_store is not None:
+            _user_store.close()
+            _user_store = None
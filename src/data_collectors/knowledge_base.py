@@ -1,31 +1,67 @@
 """Knowledge base data collector for Zendesk."""
-from typing import Dict, Any, List, Optional
-from collections import defaultdict
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from collections import Counter, defaultdict
+from pathlib import Path
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
+from src.data_collectors._user_fetch import cache_users, get_user_info, prefetch_users
 from src.exporters.markdown_formatter import MarkdownFormatter
-from src.utils.config import config
-from rich.console import Console
-from rich.progress import Progress
+from src.utils.console import console
+from rich.progress import Progress, TaskID
+
+
+# Refresh progress bars every N items instead of on every item
+PROGRESS_UPDATE_INTERVAL = 64
+
+# Shared placeholder for missing section/category info (read-only)
+_EMPTY_INFO: Dict[str, Any] = {}
+
+# Article fields used by the template, the indexes and the statistics
+ARTICLE_FIELDS = (
+    'id', 'title', 'body', 'locale', 'position', 'created_at', 'updated_at',
+    'vote_sum', 'vote_count', 'label_names', 'attachments', 'section_id', 'author_id',
+)
+
+
+def _project_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the article fields the exporter uses.
+    
+    Args:
+        article: Article data as returned by the API
+        
+    Returns:
+        Article data limited to ARTICLE_FIELDS
+    """
+    return {field: article[field] for field in ARTICLE_FIELDS if field in article}
 
 
 class KnowledgeBaseCollector:
     """Collector for Zendesk knowledge base data."""
     
-    def __init__(self):
-        """Initialize knowledge base collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('knowledge-base')
-        self.console = Console()
+    def __init__(self, show_progress: bool = True):
+        """Initialize knowledge base collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('knowledge-base')
+        self.console = console
+        self.show_progress = show_progress
         
         # Cache for related data
-        self.users_cache = {}
         self.sections_cache = {}
         self.categories_cache = {}
+        
+        # section_id -> (section info, category info), built once sections are loaded
+        self._section_index = {}
     
-    def collect_all(self) -> Dict[str, List[Dict[str, Any]]]:
+    def collect_all(self, include_authors: bool = True) -> Dict[str, List[Dict[str, Any]]]:
         """Collect all knowledge base data.
         
+        Args:
+            include_authors: Whether to look up article authors
+            
         Returns:
             Dictionary with articles, sections, and categories
         """
@@ -43,15 +79,22 @@ class KnowledgeBaseCollector:
             
             # Collect sections
             result['sections'] = self._collect_sections()
+            self._build_section_index()
             
-            # Collect articles
-            result['articles'] = self._collect_articles()
+            # Collect articles, with their authors sideloaded on each page where the API supports it
+            articles = self._collect_articles_sideloaded() if include_authors else None
+            if articles is None:
+                articles = self._collect_articles(include_authors)
+            result['articles'] = articles
             
             return result
             
         except ZendeskAPIError as e:
             self.console.print(f"❌ Error collecting knowledge base data: {e}", style="bold red")
             return result
+        finally:
+            # Keep ETags so the next run can revalidate unchanged pages
+            self.client.save_cache()
     
     def _collect_categories(self) -> List[Dict[str, Any]]:
         """Collect help center categories.
@@ -63,7 +106,7 @@ class KnowledgeBaseCollector:
         total_categories = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching categories...", total=None)
                 
                 for category in self.client.get_help_center_categories():
@@ -71,7 +114,9 @@ class KnowledgeBaseCollector:
                     self.categories_cache[category['id']] = category
                     total_categories += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_categories} categories...")
+                    if total_categories % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_categories} categories...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_categories} categories")
             
@@ -92,7 +137,7 @@ class KnowledgeBaseCollector:
         total_sections = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching sections...", total=None)
                 
                 for section in self.client.get_help_center_sections():
@@ -103,7 +148,9 @@ class KnowledgeBaseCollector:
                     self.sections_cache[section['id']] = section
                     total_sections += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_sections} sections...")
+                    if total_sections % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_sections} sections...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_sections} sections")
             
@@ -114,9 +161,19 @@ class KnowledgeBaseCollector:
         
         return sections
     
-    def _collect_articles(self) -> List[Dict[str, Any]]:
+    def _build_section_index(self):
+        """Index sections by ID together with their category for article enrichment."""
+        self._section_index = {
+            section_id: (section, self.categories_cache.get(section.get('category_id'), _EMPTY_INFO))
+            for section_id, section in self.sections_cache.items()
+        }
+    
+    def _collect_articles(self, include_authors: bool = True) -> List[Dict[str, Any]]:
         """Collect help center articles.
         
+        Args:
+            include_authors: Whether to look up article authors
+            
         Returns:
             List of article data
         """
@@ -124,20 +181,22 @@ class KnowledgeBaseCollector:
         total_articles = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching articles...", total=None)
                 
                 for article in self.client.get_help_center_articles():
-                    # Enrich article data
-                    enriched_article = self._enrich_article_data(article)
-                    
-                    articles.append(enriched_article)
+                    # Drop unused payload fields so large KBs stay small in memory
+                    articles.append(_project_article(article))
                     total_articles += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_articles} articles...")
+                    if total_articles % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_articles} articles...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_articles} articles")
             
+            self._enrich_articles(articles, include_authors)
+            
             self.console.print(f"✅ Successfully collected {total_articles} articles", style="bold green")
             
         except ZendeskAPIError as e:
@@ -145,48 +204,77 @@ class KnowledgeBaseCollector:
         
         return articles
     
-    def _enrich_article_data(self, article: Dict[str, Any]) -> Dict[str, Any]:
-        """Enrich article data with additional information.
+    def _collect_articles_sideloaded(self) -> Optional[List[Dict[str, Any]]]:
+        """Collect articles with their authors sideloaded on each page.
         
-        Args:
-            article: Base article data
-            
         Returns:
-            Enriched article data
+            List of article data, or None if the API didn't return the sideloaded users
         """
-        # Add author information
-        article['author_info'] = self._get_user_info(article.get('author_id'))
+        articles = []
         
-        # Add section information
-        article['section_info'] = self.sections_cache.get(article.get('section_id'), {})
+        try:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
+                task = progress.add_task("Fetching articles...", total=None)
+                
+                for page in self.client.get_help_center_article_pages(include='users'):
+                    if 'users' not in page:
+                        # Sideloading not supported here, use the plain article pass instead
+                        return None
+                    
+                    # Sideloaded authors are kept for this run and persisted for the next
+                    cache_users(page['users'])
+                    
+                    # Drop unused payload fields so large KBs stay small in memory
+                    page_articles = page.get('articles', [])
+                    articles.extend(map(_project_article, page_articles))
+                    progress.update(task, advance=len(page_articles),
+                                    description=f"Fetched {len(articles)} articles...")
+                
+                progress.update(task, completed=True, description=f"Collected {len(articles)} articles")
+        except ZendeskAPIError:
+            # The include parameter may be rejected; the plain pass reports real errors
+            return None
         
-        # Add category information (through section)
-        section = article.get('section_info', {})
-        if section:
-            article['category_info'] = section.get('category_info', {})
+        try:
+            self._enrich_articles(articles)
+        except ZendeskAPIError as e:
+            self.console.print(f"❌ Error enriching articles: {e}", style="bold red")
         
-        return article
+        self.console.print(f"✅ Successfully collected {len(articles)} articles", style="bold green")
+        return articles
+    
+    def _enrich_articles(self, articles: List[Dict[str, Any]], include_authors: bool = True):
+        """Enrich collected articles, resolving any authors not cached yet in batches.
+        
+        Args:
+            articles: List of article data
+            include_authors: Whether to look up article authors
+        """
+        if include_authors:
+            # Resolve all authors not sideloaded or cached, in batches
+            prefetch_users(self.client, (article.get('author_id') for article in articles))
+        for article in articles:
+            self._enrich_article_data(article, include_authors)
     
-    def _get_user_info(self, user_id: Optional[int]) -> Dict[str, Any]:
-        """Get user information with caching.
+    def _enrich_article_data(self, article: Dict[str, Any], include_authors: bool = True) -> Dict[str, Any]:
+        """Enrich article data with additional information.
         
         Args:
-            user_id: User ID
+            article: Base article data
+            include_authors: Whether to look up the article author
             
         Returns:
-            User information dictionary
+            Enriched article data
         """
-        if not user_id:
-            return {}
+        # Add author information
+        article['author_info'] = get_user_info(self.client, article.get('author_id')) if include_authors else {}
         
-        if user_id not in self.users_cache:
-            try:
-                response = self.client.get(f'/users/{user_id}.json')
-                self.users_cache[user_id] = response.get('user', {})
-            except ZendeskAPIError:
-                self.users_cache[user_id] = {}
+        # Add section and category information in a single lookup
+        section, category = self._section_index.get(article.get('section_id'), (_EMPTY_INFO, _EMPTY_INFO))
+        article['section_info'] = section
+        article['category_info'] = category
         
-        return self.users_cache[user_id]
+        return article
     
     def export_to_markdown(self, kb_data: Dict[str, List[Dict[str, Any]]]) -> bool:
         """Export knowledge base data to markdown files.
@@ -205,36 +293,22 @@ class KnowledgeBaseCollector:
             # Export articles organized by section/category
             articles = kb_data.get('articles', [])
             if articles:
+                # Filled while rendering, then used for the per-section indexes
                 articles_by_section = defaultdict(list)
                 
-                for article in articles:
-                    section_name = article.get('section_info', {}).get('name', 'uncategorized')
-                    section_name = self.formatter.sanitize_filename(section_name.lower())
-                    articles_by_section[section_name].append(article)
-                
-                with Progress() as progress:
+                with Progress(console=self.console, disable=not self.show_progress) as progress:
                     total_articles = len(articles)
                     task = progress.add_task("Exporting articles...", total=total_articles)
                     
-                    for section_name, section_articles in articles_by_section.items():
-                        for article in section_articles:
-                            # Prepare context for template
-                            context = self._prepare_article_context(article)
-                            
-                            # Generate markdown content
-                            content = self.formatter.format_article(article, **context)
-                            
-                            # Determine output path (organize by section)
-                            output_path = self.formatter.get_output_path(article, section_name)
-                            
-                            # Write file
-                            if self.formatter.write_file(content, output_path):
-                                total_exported += 1
-                            
-                            progress.update(task, advance=1)
-                        
-                        # Create index for this section
-                        self.formatter.create_index_file(section_articles, section_name)
+                    # Articles are rendered lazily while earlier ones are being written
+                    total_exported += self.formatter.write_files(
+                        self._render_articles(articles, articles_by_section, progress, task)
+                    )
+                    progress.update(task, completed=total_articles)
+                
+                # Create index for each section
+                for section_name, section_articles in articles_by_section.items():
+                    self.formatter.create_index_file(section_articles, section_name)
                 
                 # Create main index
                 self.formatter.create_index_file(articles)
@@ -246,6 +320,48 @@ class KnowledgeBaseCollector:
             self.console.print(f"❌ Error exporting knowledge base: {e}", style="bold red")
             return False
     
+    def _render_articles(self, articles: List[Dict[str, Any]],
+                         articles_by_section: Dict[str, List[Dict[str, Any]]],
+                         progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render articles to markdown in a single pass, grouping them by section.
+        
+        Args:
+            articles: Articles to render
+            articles_by_section: Mapping filled with articles per sanitized section directory name
+            progress: Progress display to update
+            task: Progress task for the export
+            
+        Yields:
+            Tuples of (markdown content, output path)
+        """
+        # Sanitize each section's directory name once, not once per article
+        section_dirs = {}
+        rendered = 0
+        
+        for article in articles:
+            section_id = article.get('section_id')
+            section_name = section_dirs.get(section_id)
+            if section_name is None:
+                section_name = article.get('section_info', {}).get('name', 'uncategorized')
+                section_name = self.formatter.sanitize_filename(section_name.lower())
+                section_dirs[section_id] = section_name
+            articles_by_section[section_name].append(article)
+            
+            # Prepare context for template
+            context = self._prepare_article_context(article)
+            
+            # Generate markdown content
+            content = self.formatter.format_article(article, **context)
+            
+            # Determine output path (organize by section)
+            output_path = self.formatter.get_output_path(article, section_name)
+            
+            yield content, output_path
+            
+            rendered += 1
+            if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
+    
     def _prepare_article_context(self, article: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare context for article template.
         
@@ -264,16 +380,12 @@ class KnowledgeBaseCollector:
         # Section information
         section = article.get('section_info', {})
         context['section_name'] = section.get('name', 'Unknown')
-        context['section_file'] = self.formatter.sanitize_filename(
-            f"{section.get('id', 'unknown')}-{section.get('name', 'unknown')}"
-        )
+        context['section_file'] = self.formatter.link_filename(section)
         
         # Category information
         category = article.get('category_info', {})
         context['category_name'] = category.get('name', 'Unknown')
-        context['category_file'] = self.formatter.sanitize_filename(
-            f"{category.get('id', 'unknown')}-{category.get('name', 'unknown')}"
-        )
+        context['category_file'] = self.formatter.link_filename(category)
         
         return context
     
@@ -294,27 +406,15 @@ class KnowledgeBaseCollector:
             'total_articles': len(articles),
             'total_sections': len(sections),
             'total_categories': len(categories),
-            'articles_by_locale': defaultdict(int),
+            'articles_by_locale': Counter(article.get('locale', 'unknown') for article in articles),
             'articles_with_votes': 0,
             'average_votes': 0,
         }
         
-        total_votes = 0
-        articles_with_votes = 0
-        
-        for article in articles:
-            # Locale stats
-            locale = article.get('locale', 'unknown')
-            stats['articles_by_locale'][locale] += 1
-            
-            # Vote stats
-            vote_sum = article.get('vote_sum', 0)
-            if vote_sum:
-                articles_with_votes += 1
-                total_votes += vote_sum
-        
-        stats['articles_with_votes'] = articles_with_votes
-        if articles_with_votes > 0:
-            stats['average_votes'] = total_votes / articles_with_votes
+        # Vote stats: one pass collects the non-zero vote sums, builtins do the reductions
+        votes = list(filter(None, (article.get('vote_sum') for article in articles)))
+        stats['articles_with_votes'] = len(votes)
+        if votes:
+            stats['average_votes'] = sum(votes) / len(votes)
         
         return stats 
\ No newline at end of file
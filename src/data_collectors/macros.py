@@ -1,22 +1,42 @@
 """Macros and groups data collector for Zendesk."""
-from typing import Dict, Any, List, Optional
+import logging
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
+from src.data_collectors._user_fetch import get_user_info, prefetch_users
 from src.exporters.markdown_formatter import MarkdownFormatter
 from src.utils.config import config
-from rich.console import Console
-from rich.progress import Progress
+from src.utils.console import console
+from rich.progress import Progress, TaskID
+
+
+logger = logging.getLogger(__name__)
+
+# Refresh progress bars every N items instead of on every item
+PROGRESS_UPDATE_INTERVAL = 256
 
 
 class MacrosCollector:
     """Collector for Zendesk macros data."""
     
-    def __init__(self):
-        """Initialize macros collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('macros')
-        self.console = Console()
+    def __init__(self, show_progress: bool = True):
+        """Initialize macros collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('macros')
+        self.console = console
+        self.show_progress = show_progress
+        
+        # Statistics accumulated during collection, for the list collect_all returned
+        self._stats = None
+        self._stats_source = None
     
     def collect_all(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """Collect all macros data.
@@ -31,24 +51,27 @@ class MacrosCollector:
         
         macros = []
         total_macros = 0
+        stats = self._empty_statistics()
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching macros...", total=None)
                 
-                for macro in self.client.get_macros():
-                    # Filter by active status if requested
-                    if active_only and not macro.get('active', True):
-                        continue
-                    
+                # Let the API drop inactive macros instead of fetching and discarding them
+                params = {'active': 'true'} if active_only else {}
+                for macro in self.client.get_macros(paginate='cursor', **params):
                     macros.append(macro)
                     total_macros += 1
+                    self._count_macro(stats, macro)
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_macros} macros...")
+                    if total_macros % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_macros} macros...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_macros} macros")
             
             self.console.print(f"✅ Successfully collected {total_macros} macros", style="bold green")
+            self._stats, self._stats_source = stats, macros
             return macros
             
         except ZendeskAPIError as e:
@@ -69,21 +92,12 @@ class MacrosCollector:
         total_exported = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Exporting macros...", total=len(macros))
                 
-                for macro in macros:
-                    # Generate markdown content
-                    content = self.formatter.format_macro(macro)
-                    
-                    # Determine output path
-                    output_path = self.formatter.get_output_path(macro)
-                    
-                    # Write file
-                    if self.formatter.write_file(content, output_path):
-                        total_exported += 1
-                    
-                    progress.update(task, advance=1)
+                # Macros are rendered lazily while earlier ones are being written
+                total_exported += self.formatter.write_files(self._render_macros(macros, progress, task))
+                progress.update(task, completed=len(macros))
                 
                 # Create main index
                 self.formatter.create_index_file(macros)
@@ -95,6 +109,30 @@ class MacrosCollector:
             self.console.print(f"❌ Error exporting macros: {e}", style="bold red")
             return False
     
+    def _render_macros(self, macros: List[Dict[str, Any]],
+                       progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render macros to markdown.
+        
+        Args:
+            macros: List of macro data
+            progress: Progress display to update
+            task: Progress task for the export
+            
+        Yields:
+            Tuples of (markdown content, output path)
+        """
+        # Generate markdown content (large batches render in worker processes)
+        contents = self.formatter.render_many('macro', [(macro, {}) for macro in macros])
+        
+        for rendered, (macro, content) in enumerate(zip(macros, contents), 1):
+            # Determine output path
+            output_path = self.formatter.get_output_path(macro)
+            
+            yield content, output_path
+            
+            if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
+    
     def get_statistics(self, macros: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get statistics about collected macros.
         
@@ -104,39 +142,70 @@ class MacrosCollector:
         Returns:
             Statistics dictionary
         """
-        stats = {
-            'total_macros': len(macros),
+        # Already counted while collecting
+        if macros is self._stats_source:
+            return self._stats
+        
+        stats = self._empty_statistics()
+        for macro in macros:
+            self._count_macro(stats, macro)
+        
+        return stats
+    
+    def _empty_statistics(self) -> Dict[str, Any]:
+        """Create an empty statistics accumulator.
+        
+        Returns:
+            Statistics dictionary with zeroed counters
+        """
+        return {
+            'total_macros': 0,
             'active_macros': 0,
             'inactive_macros': 0,
             'action_types': defaultdict(int),
         }
+    
+    def _count_macro(self, stats: Dict[str, Any], macro: Dict[str, Any]):
+        """Add a macro to the statistics.
         
-        for macro in macros:
-            if macro.get('active', True):
-                stats['active_macros'] += 1
-            else:
-                stats['inactive_macros'] += 1
-            
-            # Count action types
-            actions = macro.get('actions', [])
-            for action in actions:
-                action_field = action.get('field', 'unknown')
-                stats['action_types'][action_field] += 1
+        Args:
+            stats: Statistics accumulator
+            macro: Macro data
+        """
+        stats['total_macros'] += 1
+        if macro.get('active', True):
+            stats['active_macros'] += 1
+        else:
+            stats['inactive_macros'] += 1
         
-        return stats
+        # Count action types
+        actions = macro.get('actions')
+        if actions:
+            action_types = stats['action_types']
+            for action in actions:
+                action_types[action.get('field', 'unknown')] += 1
 
 
 class GroupsCollector:
     """Collector for Zendesk groups data."""
     
-    def __init__(self):
-        """Initialize groups collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('groups')
-        self.console = Console()
+    def __init__(self, show_progress: bool = True):
+        """Initialize groups collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('groups')
+        self.console = console
+        self.show_progress = show_progress
         
         # Cache for related data
-        self.users_cache = {}
+        self.memberships_cache = {}  # group_id -> member user IDs
+        
+        # Statistics accumulated during collection, for the list collect_all returned
+        self._stats = None
+        self._stats_source = None
     
     def collect_all(self, include_deleted: bool = False) -> List[Dict[str, Any]]:
         """Collect all groups data.
@@ -153,25 +222,48 @@ class GroupsCollector:
         total_groups = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching groups...", total=None)
                 
-                for group in self.client.get_groups():
-                    # Filter deleted groups if requested
-                    if not include_deleted and group.get('deleted', False):
-                        continue
-                    
-                    # Enrich group data
-                    enriched_group = self._enrich_group_data(group)
-                    
-                    groups.append(enriched_group)
+                # The groups list omits deleted groups; they come from their own endpoint
+                all_groups = self.client.get_groups(paginate='cursor')
+                if include_deleted:
+                    all_groups = chain(all_groups, self.client.get_deleted_groups())
+                
+                for group in all_groups:
+                    groups.append(group)
                     total_groups += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_groups} groups...")
+                    if total_groups % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_groups} groups...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_groups} groups")
+                
+                # One account-wide membership scan replaces a request per group
+                if not self._load_all_memberships(groups):
+                    # Membership lookups are latency-bound, so keep several groups' requests in flight
+                    enrich_task = progress.add_task("Fetching group memberships...", total=total_groups)
+                    with ThreadPoolExecutor(max_workers=self.client.max_concurrent_requests) as executor:
+                        group_ids = (group['id'] for group in groups)
+                        for done, _ in enumerate(executor.map(self._get_group_member_ids, group_ids), 1):
+                            if done % PROGRESS_UPDATE_INTERVAL == 0:
+                                progress.update(enrich_task, advance=PROGRESS_UPDATE_INTERVAL)
+                    progress.update(enrich_task, completed=total_groups)
+            
+            # Resolve every member once, in batches, then attach agents to their groups
+            member_ids = set()
+            for group in groups:
+                member_ids.update(self._get_group_member_ids(group['id']))
+            prefetch_users(self.client, member_ids)
+            
+            stats = self._empty_statistics()
+            for group in groups:
+                self._enrich_group_data(group)
+                self._count_group(stats, group)
             
             self.console.print(f"✅ Successfully collected {total_groups} groups", style="bold green")
+            self._stats, self._stats_source = stats, groups
             return groups
             
         except ZendeskAPIError as e:
@@ -201,41 +293,64 @@ class GroupsCollector:
         Returns:
             List of agent information
         """
-        if group_id in self.users_cache:
-            return self.users_cache[group_id]
+        agents = []
+        for user_id in self._get_group_member_ids(group_id):
+            user_info = get_user_info(self.client, user_id)
+            if user_info:
+                agents.append(user_info)
         
-        try:
-            response = self.client.get(f'/groups/{group_id}/memberships.json')
-            memberships = response.get('group_memberships', [])
+        return agents
+    
+    def _load_all_memberships(self, groups: List[Dict[str, Any]]) -> bool:
+        """Load the memberships of every group from the account-wide memberships listing.
+        
+        Args:
+            groups: Groups whose memberships are needed
             
-            agents = []
-            for membership in memberships:
+        Returns:
+            True if the memberships cache now covers all groups, False on API errors
+        """
+        members_by_group = defaultdict(list)
+        
+        try:
+            for membership in self.client.get_paginated('/group_memberships.json', paginate='cursor'):
                 user_id = membership.get('user_id')
                 if user_id:
-                    user_info = self._get_user_info(user_id)
-                    if user_info:
-                        agents.append(user_info)
-            
-            self.users_cache[group_id] = agents
-            return agents
+                    members_by_group[membership.get('group_id')].append(user_id)
         except ZendeskAPIError:
-            self.users_cache[group_id] = []
-            return []
+            return False
+        
+        # Groups without members still need an entry so they aren't looked up one by one
+        for group in groups:
+            self.memberships_cache[group['id']] = members_by_group.get(group['id'], [])
+        
+        return True
     
-    def _get_user_info(self, user_id: int) -> Dict[str, Any]:
-        """Get user information.
+    def _get_group_member_ids(self, group_id: int) -> List[int]:
+        """Get the IDs of users belonging to a group.
         
         Args:
-            user_id: User ID
+            group_id: Group ID
             
         Returns:
-            User information dictionary
+            List of member user IDs
         """
+        if group_id in self.memberships_cache:
+            return self.memberships_cache[group_id]
+        
         try:
-            response = self.client.get(f'/users/{user_id}.json')
-            return response.get('user', {})
-        except ZendeskAPIError:
-            return {}
+            response = self.client.get(f'/groups/{group_id}/memberships.json')
+            memberships = response.get('group_memberships', [])
+            user_ids = [membership['user_id'] for membership in memberships if membership.get('user_id')]
+        except ZendeskAPIError as e:
+            # Only a missing group is a definitive empty answer; anything else must not be cached
+            if e.status_code != 404:
+                logger.warning("Failed to fetch memberships of group %s: %s", group_id, e)
+                return []
+            user_ids = []
+        
+        self.memberships_cache[group_id] = user_ids
+        return user_ids
     
     def export_to_markdown(self, groups: List[Dict[str, Any]]) -> bool:
         """Export groups to markdown files.
@@ -251,24 +366,12 @@ class GroupsCollector:
         total_exported = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Exporting groups...", total=len(groups))
                 
-                for group in groups:
-                    # Prepare context for template
-                    context = self._prepare_group_context(group)
-                    
-                    # Generate markdown content
-                    content = self.formatter.format_group(group, **context)
-                    
-                    # Determine output path
-                    output_path = self.formatter.get_output_path(group)
-                    
-                    # Write file
-                    if self.formatter.write_file(content, output_path):
-                        total_exported += 1
-                    
-                    progress.update(task, advance=1)
+                # Groups are rendered lazily while earlier ones are being written
+                total_exported += self.formatter.write_files(self._render_groups(groups, progress, task))
+                progress.update(task, completed=len(groups))
                 
                 # Create main index
                 self.formatter.create_index_file(groups)
@@ -280,6 +383,33 @@ class GroupsCollector:
             self.console.print(f"❌ Error exporting groups: {e}", style="bold red")
             return False
     
+    def _render_groups(self, groups: List[Dict[str, Any]],
+                       progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render groups to markdown.
+        
+        Args:
+            groups: List of group data
+            progress: Progress display to update
+            task: Progress task for the export
+            
+        Yields:
+            Tuples of (markdown content, output path)
+        """
+        # Prepare context for template
+        records = [(group, self._prepare_group_context(group)) for group in groups]
+        
+        # Generate markdown content (large batches render in worker processes)
+        contents = self.formatter.render_many('group', records)
+        
+        for rendered, (group, content) in enumerate(zip(groups, contents), 1):
+            # Determine output path
+            output_path = self.formatter.get_output_path(group)
+            
+            yield content, output_path
+            
+            if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
+    
     def _prepare_group_context(self, group: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare context for group template.
         
@@ -293,15 +423,10 @@ class GroupsCollector:
         
         # Agents information
         agents = group.get('agents_info', [])
-        agents_with_filenames = []
-        for agent in agents:
-            agent_data = agent.copy()
-            agent_data['filename'] = self.formatter.sanitize_filename(
-                f"{agent.get('id', 'unknown')}-{agent.get('name', 'unknown')}"
-            )
-            agents_with_filenames.append(agent_data)
+        context['agents'] = agents
         
-        context['agents'] = agents_with_filenames
+        # Link targets keyed by user ID, so the shared user records aren't copied
+        context['filenames'] = self.formatter.build_filename_index(agents)
         
         return context
     
@@ -314,24 +439,47 @@ class GroupsCollector:
         Returns:
             Statistics dictionary
         """
-        stats = {
-            'total_groups': len(groups),
+        # Already counted while collecting
+        if groups is self._stats_source:
+            return self._stats
+        
+        stats = self._empty_statistics()
+        for group in groups:
+            self._count_group(stats, group)
+        
+        return stats
+    
+    def _empty_statistics(self) -> Dict[str, Any]:
+        """Create an empty statistics accumulator.
+        
+        Returns:
+            Statistics dictionary with zeroed counters
+        """
+        return {
+            'total_groups': 0,
             'default_groups': 0,
             'deleted_groups': 0,
             'groups_with_agents': 0,
             'total_agents': 0,
         }
+    
+    def _count_group(self, stats: Dict[str, Any], group: Dict[str, Any]):
+        """Add a group to the statistics.
         
-        for group in groups:
-            if group.get('default', False):
-                stats['default_groups'] += 1
-            
-            if group.get('deleted', False):
-                stats['deleted_groups'] += 1
-            
-            agents = group.get('agents_info', [])
-            if agents:
-                stats['groups_with_agents'] += 1
-                stats['total_agents'] += len(agents)
+        Args:
+            stats: Statistics accumulator
+            group: Enriched group data
+        """
+        # Plain get() without defaults: only truthiness matters here
+        get = group.get
+        stats['total_groups'] += 1
+        if get('default'):
+            stats['default_groups'] += 1
+        
+        if get('deleted'):
+            stats['deleted_groups'] += 1
         
-        return stats 
\ No newline at end of file
+        agents = get('agents_info')
+        if agents:
+            stats['groups_with_agents'] += 1
+            stats['total_agents'] += len(agents)
\ No newline at end of file
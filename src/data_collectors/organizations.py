@@ -1,25 +1,49 @@
 """Organizations data collector for Zendesk."""
-from typing import Dict, Any, List, Optional
+import logging
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
+from src.data_collectors._user_fetch import cache_users
 from src.exporters.markdown_formatter import MarkdownFormatter
 from src.utils.config import config
-from rich.console import Console
-from rich.progress import Progress
+from src.utils.console import console
+from src.utils.disk_cache import DiskCache
+from src.utils.lru import LRUCache
+from rich.progress import Progress, TaskID
+
+
+logger = logging.getLogger(__name__)
+
+# Refresh progress bars every N items instead of on every item
+PROGRESS_UPDATE_INTERVAL = 256
 
 
 class OrganizationsCollector:
     """Collector for Zendesk organizations data."""
     
-    def __init__(self):
-        """Initialize organizations collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('organizations')
-        self.console = Console()
-        
-        # Cache for related data
-        self.users_cache = {}
+    def __init__(self, show_progress: bool = True):
+        """Initialize organizations collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('organizations')
+        self.console = console
+        self.show_progress = show_progress
+        
+        # Cache for related data, bounded for tenants with many organizations
+        self.users_cache = LRUCache(maxsize=4096)
+        
+        # Organization users persisted across runs, open while collecting
+        self._users_store = None
+        
+        # Statistics accumulated during collection, for the list collect_all returned
+        self._stats = None
+        self._stats_source = None
     
     def collect_all(self) -> List[Dict[str, Any]]:
         """Collect all organizations data.
@@ -33,26 +57,48 @@ class OrganizationsCollector:
         total_organizations = 0
         
         try:
-            with Progress() as progress:
+            cache_config = config.get_cache_config()
+            self._users_store = DiskCache(
+                Path(cache_config['directory']) / 'organization_users.sqlite',
+                ttl_seconds=cache_config['ttl_days'] * 86400
+            )
+            
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching organizations...", total=None)
                 
-                for organization in self.client.get_organizations():
-                    # Get additional organization details
-                    enriched_org = self._enrich_organization_data(organization)
-                    
-                    organizations.append(enriched_org)
+                for organization in self.client.get_organizations(paginate='cursor'):
+                    organizations.append(organization)
                     total_organizations += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_organizations} organizations...")
+                    if total_organizations % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_organizations} organizations...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_organizations} organizations")
+                
+                # Enrichment is latency-bound, so keep several organizations' requests in flight
+                enrich_task = progress.add_task("Fetching organization users...", total=total_organizations)
+                stats = self._empty_statistics()
+                with ThreadPoolExecutor(max_workers=self.client.max_concurrent_requests) as executor:
+                    enriched = executor.map(self._enrich_organization_data, organizations)
+                    for done, organization in enumerate(enriched, 1):
+                        self._count_organization(stats, organization)
+                        if done % PROGRESS_UPDATE_INTERVAL == 0:
+                            progress.update(enrich_task, advance=PROGRESS_UPDATE_INTERVAL)
+                progress.update(enrich_task, completed=total_organizations)
             
             self.console.print(f"✅ Successfully collected {total_organizations} organizations", style="bold green")
+            self._stats, self._stats_source = stats, organizations
             return organizations
             
         except ZendeskAPIError as e:
             self.console.print(f"❌ Error collecting organizations: {e}", style="bold red")
             return []
+        
+        finally:
+            if self._users_store is not None:
+                self._users_store.close()
+                self._users_store = None
     
     def _enrich_organization_data(self, organization: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich organization data with additional information.
@@ -77,19 +123,29 @@ class OrganizationsCollector:
         Returns:
             List of user information
         """
-        if org_id in self.users_cache:
-            return self.users_cache[org_id]
+        users = self.users_cache.get(org_id)
+        if users is not None:
+            return users
         
-        try:
-            users = []
-            for user in self.client.get_paginated(f'/organizations/{org_id}/users.json'):
-                users.append(user)
+        users = self._users_store.get(org_id) if self._users_store is not None else None
+        if users is None:
+            try:
+                users = list(self.client.get_paginated(f'/organizations/{org_id}/users.json', paginate='cursor'))
+            except ZendeskAPIError as e:
+                # Only a missing organization is a definitive empty answer; anything else must not be cached
+                if e.status_code != 404:
+                    logger.warning("Failed to fetch users of organization %s: %s", org_id, e)
+                    return []
+                users = []
+            else:
+                if self._users_store is not None:
+                    self._users_store.set(org_id, users)
             
-            self.users_cache[org_id] = users
-            return users
-        except ZendeskAPIError:
-            self.users_cache[org_id] = []
-            return []
+            # Full user records; other collectors in this run can reuse them
+            cache_users(users)
+        
+        self.users_cache.set(org_id, users)
+        return users
     
     def export_to_markdown(self, organizations: List[Dict[str, Any]]) -> bool:
         """Export organizations to markdown files.
@@ -105,24 +161,14 @@ class OrganizationsCollector:
         total_exported = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Exporting organizations...", total=len(organizations))
                 
-                for organization in organizations:
-                    # Prepare context for template
-                    context = self._prepare_organization_context(organization)
-                    
-                    # Generate markdown content
-                    content = self.formatter.format_organization(organization, **context)
-                    
-                    # Determine output path
-                    output_path = self.formatter.get_output_path(organization)
-                    
-                    # Write file
-                    if self.formatter.write_file(content, output_path):
-                        total_exported += 1
-                    
-                    progress.update(task, advance=1)
+                # Organizations are rendered lazily while earlier ones are being written
+                total_exported += self.formatter.write_files(
+                    self._render_organizations(organizations, progress, task)
+                )
+                progress.update(task, completed=len(organizations))
                 
                 # Create main index
                 self.formatter.create_index_file(organizations)
@@ -134,6 +180,34 @@ class OrganizationsCollector:
             self.console.print(f"❌ Error exporting organizations: {e}", style="bold red")
             return False
     
+    def _render_organizations(self, organizations: List[Dict[str, Any]],
+                              progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render organizations to markdown.
+        
+        Args:
+            organizations: List of organization data
+            progress: Progress display to update
+            task: Progress task for the export
+            
+        Yields:
+            Tuples of (markdown content, output path)
+        """
+        # Prepare context for template
+        records = [(organization, self._prepare_organization_context(organization))
+                   for organization in organizations]
+        
+        # Generate markdown content (large batches render in worker processes)
+        contents = self.formatter.render_many('organization', records)
+        
+        for rendered, (organization, content) in enumerate(zip(organizations, contents), 1):
+            # Determine output path
+            output_path = self.formatter.get_output_path(organization)
+            
+            yield content, output_path
+            
+            if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
+    
     def _prepare_organization_context(self, organization: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare context for organization template.
         
@@ -147,15 +221,10 @@ class OrganizationsCollector:
         
         # Users information
         users = organization.get('users_info', [])
-        users_with_filenames = []
-        for user in users:
-            user_data = user.copy()
-            user_data['filename'] = self.formatter.sanitize_filename(
-                f"{user.get('id', 'unknown')}-{user.get('name', 'unknown')}"
-            )
-            users_with_filenames.append(user_data)
+        context['users'] = users
         
-        context['users'] = users_with_filenames
+        # Link targets keyed by user ID; the template only links the first 10 users
+        context['filenames'] = self.formatter.build_filename_index(users[:10])
         
         return context
     
@@ -168,24 +237,47 @@ class OrganizationsCollector:
         Returns:
             Statistics dictionary
         """
-        stats = {
-            'total_organizations': len(organizations),
+        # Already counted while collecting
+        if organizations is self._stats_source:
+            return self._stats
+        
+        stats = self._empty_statistics()
+        for org in organizations:
+            self._count_organization(stats, org)
+        
+        return stats
+    
+    def _empty_statistics(self) -> Dict[str, Any]:
+        """Create an empty statistics accumulator.
+        
+        Returns:
+            Statistics dictionary with zeroed counters
+        """
+        return {
+            'total_organizations': 0,
             'with_users': 0,
             'total_users': 0,
             'with_domains': 0,
             'with_notes': 0,
         }
+    
+    def _count_organization(self, stats: Dict[str, Any], org: Dict[str, Any]):
+        """Add an organization to the statistics.
         
-        for org in organizations:
-            users = org.get('users_info', [])
-            if users:
-                stats['with_users'] += 1
-                stats['total_users'] += len(users)
-            
-            if org.get('domain_names'):
-                stats['with_domains'] += 1
-            
-            if org.get('notes'):
-                stats['with_notes'] += 1
+        Args:
+            stats: Statistics accumulator
+            org: Enriched organization data
+        """
+        # Plain get() without defaults: only truthiness matters here
+        get = org.get
+        stats['total_organizations'] += 1
+        users = get('users_info')
+        if users:
+            stats['with_users'] += 1
+            stats['total_users'] += len(users)
+        
+        if get('domain_names'):
+            stats['with_domains'] += 1
         
-        return stats 
\ No newline at end of file
+        if get('notes'):
+            stats['with_notes'] += 1
\ No newline at end of file
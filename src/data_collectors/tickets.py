@@ -1,29 +1,83 @@
 """Tickets data collector for Zendesk."""
-from typing import Dict, Any, List, Optional, Iterator
-from collections import defaultdict
-import time
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby
+from operator import itemgetter
+from pathlib import Path
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
+from src.data_collectors._user_fetch import cache_users, get_user_info, prefetch_users
+from src.data_collectors._resource_cache import cache_resources, get_resource, load_ticket_fields, prefetch_resources
 from src.exporters.markdown_formatter import MarkdownFormatter
 from src.utils.config import config
-from rich.console import Console
+from src.utils.console import console
 from rich.progress import Progress, TaskID
 
 
+# Refresh progress bars every N items instead of on every item
+PROGRESS_UPDATE_INTERVAL = 50
+
+# Statuses exported into their own subdirectory
+TICKET_SUBCATEGORIES = frozenset({'open', 'solved', 'closed', 'pending'})
+
+# Comment requests allowed to queue up per worker before pagination waits for them
+COMMENT_BACKLOG_PER_WORKER = 8
+
+# Fields kept from the API payloads; everything else is dropped while collecting
+TICKET_FIELDS = (
+    'id', 'subject', 'description', 'status', 'priority', 'type', 'tags',
+    'created_at', 'updated_at', 'due_at', 'satisfaction_rating', 'custom_fields',
+    'requester_id', 'assignee_id', 'organization_id', 'group_id',
+)
+COMMENT_FIELDS = ('author_id', 'created_at', 'html_body', 'attachments')
+
+# Related records sideloaded with each ticket page
+TICKET_SIDELOADS = 'users,organizations,groups'
+
+
+def _project(record: Dict[str, Any], fields: Tuple[str, ...]) -> Dict[str, Any]:
+    """Keep only the fields the collector and exporter use.
+    
+    Args:
+        record: Record as returned by the API
+        fields: Fields to keep
+        
+    Returns:
+        Record limited to the given fields
+    """
+    return {field: record[field] for field in fields if field in record}
+
+
+def _ticket_status(ticket: Dict[str, Any]) -> str:
+    """Get the status a ticket is grouped under.
+    
+    Args:
+        ticket: Ticket data
+        
+    Returns:
+        Ticket status, or 'unknown'
+    """
+    return ticket.get('status', 'unknown')
+
+
 class TicketsCollector:
     """Collector for Zendesk tickets data."""
     
-    def __init__(self):
-        """Initialize tickets collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('tickets')
-        self.console = Console()
-        
-        # Cache for related data
-        self.users_cache = {}
-        self.organizations_cache = {}
-        self.groups_cache = {}
-        self.custom_fields_cache = {}
+    def __init__(self, show_progress: bool = True):
+        """Initialize tickets collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('tickets')
+        self.console = console
+        self.show_progress = show_progress
+        
+        # Statistics accumulated during collection, for the tickets collect_all returned
+        self._stats = None
+        self._stats_source = None
     
     def collect_all(self, status_filter: Optional[str] = None, 
                    date_range: Optional[tuple] = None, 
@@ -49,31 +103,79 @@ class TicketsCollector:
             params['created<='] = date_range[1]
         
         # Collect tickets
-        tickets_by_status = defaultdict(list)
         total_tickets = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching tickets...", total=None)
+                comments_task = progress.add_task("Fetching ticket comments...", total=None,
+                                                  visible=include_comments)
                 
-                for ticket in self.client.get_tickets(**params):
-                    # Get additional ticket details if needed
-                    enriched_ticket = self._enrich_ticket_data(ticket, include_comments)
-                    
-                    status = ticket.get('status', 'unknown')
-                    tickets_by_status[status].append(enriched_ticket)
-                    total_tickets += 1
+                # Comments come first so their authors are resolved together with everyone else.
+                # They are fetched by workers while the next ticket pages load, with a bounded
+                # backlog so pagination can't run arbitrarily far ahead.
+                workers = self.client.max_concurrent_requests
+                max_backlog = workers * COMMENT_BACKLOG_PER_WORKER
+                pending = deque()
+                tickets = []
+                comments_done = 0
+                
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    # Requesters, assignees, organizations and groups arrive with each page
+                    for page in self.client.get_ticket_pages(include=TICKET_SIDELOADS, **params):
+                        cache_users(page.get('users', []))
+                        cache_resources('organizations', page.get('organizations', []))
+                        cache_resources('groups', page.get('groups', []))
+                        
+                        for ticket in page.get('tickets', []):
+                            ticket = _project(ticket, TICKET_FIELDS)
+                            tickets.append(ticket)
+                            total_tickets += 1
+                        
+                            if include_comments:
+                                pending.append(executor.submit(self._collect_ticket_comments, ticket))
+                                while len(pending) > max_backlog:
+                                    pending.popleft().result()
+                                    comments_done += 1
+                                    if comments_done % PROGRESS_UPDATE_INTERVAL == 0:
+                                        progress.update(comments_task, completed=comments_done)
+                        
+                            if total_tickets % PROGRESS_UPDATE_INTERVAL == 0:
+                                progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                                description=f"Fetched {total_tickets} tickets...")
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_tickets} tickets...")
+                    progress.update(task, completed=True, description=f"Collected {total_tickets} tickets")
+                    progress.update(comments_task, total=total_tickets)
                     
-                    # Add small delay to avoid overwhelming the API
-                    if total_tickets % 100 == 0:
-                        time.sleep(0.1)
-                
-                progress.update(task, completed=True, description=f"Collected {total_tickets} tickets")
+                    while pending:
+                        pending.popleft().result()
+                        comments_done += 1
+                        if comments_done % PROGRESS_UPDATE_INTERVAL == 0:
+                            progress.update(comments_task, completed=comments_done)
+                    progress.update(comments_task, completed=comments_done)
+            
+            # Resolve all related users, organizations and groups in batches
+            self._prefetch_related(tickets)
+            
+            stats = self._empty_statistics()
+            enrich = self._enrich_ticket_data
+            count = self._count_ticket
+            for ticket in tickets:
+                count(stats, enrich(ticket, include_comments))
+            
+            # Group the enriched tickets in one pass; the stable sort keeps each status in fetch order.
+            # The API always returns a status, so the defaulting key is only needed as a fallback.
+            status_key = itemgetter('status')
+            try:
+                tickets.sort(key=status_key)
+            except KeyError:
+                status_key = _ticket_status
+                tickets.sort(key=status_key)
+            tickets_by_status = {status: list(group) for status, group in groupby(tickets, key=status_key)}
             
             self.console.print(f"✅ Successfully collected {total_tickets} tickets", style="bold green")
-            return dict(tickets_by_status)
+            self._stats, self._stats_source = stats, tickets_by_status
+            return tickets_by_status
             
         except ZendeskAPIError as e:
             self.console.print(f"❌ Error collecting tickets: {e}", style="bold red")
@@ -89,24 +191,15 @@ class TicketsCollector:
         Returns:
             Enriched ticket data
         """
-        # Add comments if requested
+        # Enrich comments with author information; they were parsed for this ticket, so update them in place
         if include_comments:
-            try:
-                comments = self.client.get_ticket_comments(ticket['id'])
-                # Enrich comments with author information
-                enriched_comments = []
-                for comment in comments:
-                    comment_data = comment.copy()
-                    author = self._get_user_info(comment.get('author_id'))
-                    comment_data['author_name'] = author.get('name', 'Unknown')
-                    enriched_comments.append(comment_data)
-                ticket['comments'] = enriched_comments
-            except ZendeskAPIError:
-                ticket['comments'] = []
+            comments = ticket.setdefault('comments', [])
+            for comment in comments:
+                comment['author_name'] = get_user_info(self.client, comment.get('author_id')).get('name', 'Unknown')
         
         # Add related data
-        ticket['requester_info'] = self._get_user_info(ticket.get('requester_id'))
-        ticket['assignee_info'] = self._get_user_info(ticket.get('assignee_id'))
+        ticket['requester_info'] = get_user_info(self.client, ticket.get('requester_id'))
+        ticket['assignee_info'] = get_user_info(self.client, ticket.get('assignee_id'))
         ticket['organization_info'] = self._get_organization_info(ticket.get('organization_id'))
         ticket['group_info'] = self._get_group_info(ticket.get('group_id'))
         
@@ -116,26 +209,42 @@ class TicketsCollector:
         
         return ticket
     
-    def _get_user_info(self, user_id: Optional[int]) -> Dict[str, Any]:
-        """Get user information with caching.
+    def _collect_ticket_comments(self, ticket: Dict[str, Any]):
+        """Fetch the comments of a ticket.
         
         Args:
-            user_id: User ID
-            
-        Returns:
-            User information dictionary
+            ticket: Ticket data, updated in place
         """
-        if not user_id:
-            return {}
+        try:
+            ticket['comments'] = [_project(comment, COMMENT_FIELDS)
+                                  for comment in self.client.get_ticket_comments(ticket['id'])]
+        except ZendeskAPIError:
+            ticket['comments'] = []
+    
+    def _prefetch_related(self, tickets: List[Dict[str, Any]]):
+        """Fetch the users, organizations and groups referenced by tickets in batches.
         
-        if user_id not in self.users_cache:
-            try:
-                response = self.client.get(f'/users/{user_id}.json')
-                self.users_cache[user_id] = response.get('user', {})
-            except ZendeskAPIError:
-                self.users_cache[user_id] = {}
+        Records sideloaded with the ticket pages are already cached, so this mostly
+        resolves comment authors.
         
-        return self.users_cache[user_id]
+        Args:
+            tickets: Ticket data, with comments if they were collected
+        """
+        user_ids = set()
+        organization_ids = set()
+        group_ids = set()
+        
+        for ticket in tickets:
+            user_ids.add(ticket.get('requester_id'))
+            user_ids.add(ticket.get('assignee_id'))
+            for comment in ticket.get('comments', []):
+                user_ids.add(comment.get('author_id'))
+            organization_ids.add(ticket.get('organization_id'))
+            group_ids.add(ticket.get('group_id'))
+        
+        prefetch_users(self.client, user_ids)
+        prefetch_resources(self.client, 'organizations', organization_ids)
+        prefetch_resources(self.client, 'groups', group_ids)
     
     def _get_organization_info(self, org_id: Optional[int]) -> Dict[str, Any]:
         """Get organization information with caching.
@@ -146,17 +255,7 @@ class TicketsCollector:
         Returns:
             Organization information dictionary
         """
-        if not org_id:
-            return {}
-        
-        if org_id not in self.organizations_cache:
-            try:
-                response = self.client.get(f'/organizations/{org_id}.json')
-                self.organizations_cache[org_id] = response.get('organization', {})
-            except ZendeskAPIError:
-                self.organizations_cache[org_id] = {}
-        
-        return self.organizations_cache[org_id]
+        return get_resource(self.client, 'organizations', org_id)
     
     def _get_group_info(self, group_id: Optional[int]) -> Dict[str, Any]:
         """Get group information with caching.
@@ -167,17 +266,7 @@ class TicketsCollector:
         Returns:
             Group information dictionary
         """
-        if not group_id:
-            return {}
-        
-        if group_id not in self.groups_cache:
-            try:
-                response = self.client.get(f'/groups/{group_id}.json')
-                self.groups_cache[group_id] = response.get('group', {})
-            except ZendeskAPIError:
-                self.groups_cache[group_id] = {}
-        
-        return self.groups_cache[group_id]
+        return get_resource(self.client, 'groups', group_id)
     
     def _process_custom_fields(self, custom_fields: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Process custom fields into a more readable format.
@@ -189,6 +278,7 @@ class TicketsCollector:
             Processed custom fields dictionary
         """
         processed = {}
+        field_defs = load_ticket_fields(self.client)
         
         for field in custom_fields:
             field_id = field.get('id')
@@ -197,15 +287,7 @@ class TicketsCollector:
             if field_value is None:
                 continue
             
-            # Get field definition if not cached
-            if field_id not in self.custom_fields_cache:
-                try:
-                    response = self.client.get(f'/ticket_fields/{field_id}.json')
-                    self.custom_fields_cache[field_id] = response.get('ticket_field', {})
-                except ZendeskAPIError:
-                    self.custom_fields_cache[field_id] = {}
-            
-            field_def = self.custom_fields_cache[field_id]
+            field_def = field_defs.get(field_id, {})
             field_title = field_def.get('title', f'Custom Field {field_id}')
             
             processed[field_title] = field_value
@@ -226,39 +308,21 @@ class TicketsCollector:
         total_exported = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 # Calculate total tickets for progress
                 total_tickets = sum(len(tickets) for tickets in tickets_by_status.values())
                 task = progress.add_task("Exporting tickets...", total=total_tickets)
                 
+                # Tickets are rendered here while earlier ones are written by worker threads
+                total_exported += self.formatter.write_files(self._render_tickets(tickets_by_status, progress, task))
+                progress.update(task, completed=total_tickets)
+                
+                # Create index for each status
                 for status, tickets in tickets_by_status.items():
-                    self.console.print(f"Exporting {len(tickets)} {status} tickets...")
-                    
-                    for ticket in tickets:
-                        # Prepare context for template
-                        context = self._prepare_ticket_context(ticket)
-                        
-                        # Generate markdown content
-                        content = self.formatter.format_ticket(ticket, **context)
-                        
-                        # Determine output path
-                        subcategory = status if status in ['open', 'solved', 'closed', 'pending'] else None
-                        output_path = self.formatter.get_output_path(ticket, subcategory)
-                        
-                        # Write file
-                        if self.formatter.write_file(content, output_path):
-                            total_exported += 1
-                        
-                        progress.update(task, advance=1)
-                    
-                    # Create index for this status
                     self.formatter.create_index_file(tickets, status)
                 
                 # Create main index
-                all_tickets = []
-                for tickets in tickets_by_status.values():
-                    all_tickets.extend(tickets)
-                self.formatter.create_index_file(all_tickets)
+                self.formatter.create_index_file(chain.from_iterable(tickets_by_status.values()))
             
             self.console.print(f"✅ Successfully exported {total_exported} tickets", style="bold green")
             return True
@@ -267,64 +331,36 @@ class TicketsCollector:
             self.console.print(f"❌ Error exporting tickets: {e}", style="bold red")
             return False
     
-    def _prepare_ticket_context(self, ticket: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare context for ticket template.
+    def _render_tickets(self, tickets_by_status: Dict[str, List[Dict[str, Any]]],
+                        progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render tickets to markdown.
         
         Args:
-            ticket: Ticket data
+            tickets_by_status: Tickets organized by status
+            progress: Progress display to update
+            task: Progress task for the export
             
-        Returns:
-            Context dictionary for template rendering
+        Yields:
+            Tuples of (markdown content, output path)
         """
-        context = {}
-        
-        # Requester information
-        requester = ticket.get('requester_info', {})
-        context['requester_name'] = requester.get('name', 'Unknown')
-        context['requester_file'] = self.formatter.sanitize_filename(
-            f"{requester.get('id', 'unknown')}-{requester.get('name', 'unknown')}"
-        )
-        
-        # Assignee information  
-        assignee = ticket.get('assignee_info', {})
-        if assignee:
-            context['assignee_name'] = assignee.get('name')
-            context['assignee_file'] = self.formatter.sanitize_filename(
-                f"{assignee.get('id', 'unknown')}-{assignee.get('name', 'unknown')}"
-            )
-        else:
-            context['assignee_name'] = None
-            context['assignee_file'] = None
-        
-        # Organization information
-        organization = ticket.get('organization_info', {})
-        if organization:
-            context['organization_name'] = organization.get('name')
-            context['organization_file'] = self.formatter.sanitize_filename(  
-                f"{organization.get('id', 'unknown')}-{organization.get('name', 'unknown')}"
-            )
-        else:
-            context['organization_name'] = None
-            context['organization_file'] = None
-        
-        # Group information
-        group = ticket.get('group_info', {})
-        context['group_name'] = group.get('name', 'Unknown') if group else None
-        
-        # Comments with author names
-        comments = ticket.get('comments', [])
-        context['comments'] = comments
-        
-        # Custom fields table
-        custom_fields = ticket.get('custom_fields_processed', {})
-        if custom_fields:
-            headers = ['Field', 'Value']
-            rows = [[k, str(v)] for k, v in custom_fields.items()]
-            context['custom_fields_table'] = self.formatter.format_table(headers, rows)
-        else:
-            context['custom_fields_table'] = None
-        
-        return context
+        rendered = 0
+        for status, tickets in tickets_by_status.items():
+            self.console.print(f"Exporting {len(tickets)} {status} tickets...")
+            subcategory = status if status in TICKET_SUBCATEGORIES else None
+            
+            # Generate markdown content; the template reads the enriched fields directly,
+            # and large batches render in worker processes
+            contents = self.formatter.render_many('ticket', [(ticket, {}) for ticket in tickets])
+            
+            for ticket, content in zip(tickets, contents):
+                # Determine output path
+                output_path = self.formatter.get_output_path(ticket, subcategory)
+                
+                yield content, output_path
+                
+                rendered += 1
+                if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                    progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
     
     def get_statistics(self, tickets_by_status: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
         """Get statistics about collected tickets.
@@ -335,30 +371,48 @@ class TicketsCollector:
         Returns:
             Statistics dictionary
         """
-        stats = {
-            'total_tickets': sum(len(tickets) for tickets in tickets_by_status.values()),
-            'by_status': {status: len(tickets) for status, tickets in tickets_by_status.items()},
+        # Already counted while collecting
+        if tickets_by_status is self._stats_source:
+            return self._stats
+        
+        stats = self._empty_statistics()
+        for tickets in tickets_by_status.values():
+            for ticket in tickets:
+                self._count_ticket(stats, ticket)
+        
+        return stats
+    
+    def _empty_statistics(self) -> Dict[str, Any]:
+        """Create an empty statistics accumulator.
+        
+        Returns:
+            Statistics dictionary with zeroed counters
+        """
+        return {
+            'total_tickets': 0,
+            'by_status': defaultdict(int),
             'by_priority': defaultdict(int),
             'by_type': defaultdict(int),
             'with_assignee': 0,
             'with_organization': 0,
         }
+    
+    def _count_ticket(self, stats: Dict[str, Any], ticket: Dict[str, Any]):
+        """Add a ticket to the statistics.
         
-        for tickets in tickets_by_status.values():
-            for ticket in tickets:
-                # Priority stats
-                priority = ticket.get('priority', 'unknown')
-                stats['by_priority'][priority] += 1
-                
-                # Type stats
-                ticket_type = ticket.get('type', 'unknown')
-                stats['by_type'][ticket_type] += 1
-                
-                # Assignment stats
-                if ticket.get('assignee_id'):
-                    stats['with_assignee'] += 1
-                
-                if ticket.get('organization_id'):
-                    stats['with_organization'] += 1
-        
-        return stats 
\ No newline at end of file
+        Args:
+            stats: Statistics accumulator
+            ticket: Ticket data
+        """
+        get = ticket.get
+        stats['total_tickets'] += 1
+        stats['by_status'][get('status', 'unknown')] += 1
+        stats['by_priority'][get('priority', 'unknown')] += 1
+        stats['by_type'][get('type', 'unknown')] += 1
+        
+        # Assignment stats
+        if get('assignee_id'):
+            stats['with_assignee'] += 1
+        
+        if get('organization_id'):
+            stats['with_organization'] += 1 
\ No newline at end of file
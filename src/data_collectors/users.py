@@ -1,27 +1,49 @@
 """Users data collector for Zendesk."""
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from collections import defaultdict
+from itertools import chain
+from pathlib import Path
 
-from src.zendesk_client import ZendeskClient, ZendeskAPIError
+from src.zendesk_client import ZendeskAPIError, get_client
+from src.data_collectors._resource_cache import get_resource, prefetch_resources
 from src.exporters.markdown_formatter import MarkdownFormatter
 from src.utils.config import config
-from rich.console import Console
-from rich.progress import Progress
+from src.utils.console import console
+from rich.progress import Progress, TaskID
+
+
+# Refresh progress bars every N items instead of on every item
+PROGRESS_UPDATE_INTERVAL = 50
+
+# Roles exported as agents; everyone else is an end user
+AGENT_ROLES = frozenset({'admin', 'agent'})
 
 
 class UsersCollector:
     """Collector for Zendesk users data."""
     
-    def __init__(self):
-        """Initialize users collector."""
-        self.client = ZendeskClient()
-        self.formatter = MarkdownFormatter('users')
-        self.console = Console()
-        
-        # Cache for related data
-        self.organizations_cache = {}
-        self.groups_cache = {}
+    def __init__(self, show_progress: bool = True):
+        """Initialize users collector.
+        
+        Args:
+            show_progress: Whether to display live progress bars
+        """
+        self.client = get_client()
+        self.formatter = MarkdownFormatter.for_kind('users')
+        self.console = console
+        self.show_progress = show_progress
+        
+        # Cache for related data (organizations and groups live in the shared lookup cache)
         self.user_stats_cache = {}
+        self.group_ids_cache = {}  # user_id -> IDs of the groups the user belongs to
+        self._memberships_complete = False
+        
+        # Set once every ticket has been tallied, so users missing from the cache have none
+        self._stats_primed = False
+        
+        # Set by the caller when ticket tallies are on the way; users wait for it before their statistics
+        self.stats_ready: Optional[threading.Event] = None
     
     def collect_all(self, role_filter: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
         """Collect all users data.
@@ -44,27 +66,48 @@ class UsersCollector:
         total_users = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 task = progress.add_task("Fetching users...", total=None)
                 
+                users = []
                 for user in self.client.get_users(**params):
-                    # Get additional user details
-                    enriched_user = self._enrich_user_data(user)
-                    
-                    role = user.get('role', 'end-user')
-                    # Map roles to subcategories
-                    if role in ['admin', 'agent']:
-                        subcategory = 'agents'
-                    else:
-                        subcategory = 'end-users'
-                    
-                    users_by_role[subcategory].append(enriched_user)
+                    users.append(user)
                     total_users += 1
                     
-                    progress.update(task, advance=1, description=f"Fetched {total_users} users...")
+                    if total_users % PROGRESS_UPDATE_INTERVAL == 0:
+                        progress.update(task, advance=PROGRESS_UPDATE_INTERVAL,
+                                        description=f"Fetched {total_users} users...")
                 
                 progress.update(task, completed=True, description=f"Collected {total_users} users")
             
+            # One account-wide membership scan replaces a request per user
+            if not self._load_all_memberships():
+                for user in users:
+                    self._get_user_group_ids(user['id'])
+            
+            # Resolve every referenced group and organization once, in batches
+            group_ids = set()
+            for user in users:
+                group_ids.update(self.group_ids_cache.get(user['id'], ()))
+            prefetch_resources(self.client, 'groups', group_ids)
+            prefetch_resources(self.client, 'organizations', (user.get('organization_id') for user in users))
+            
+            if self.stats_ready is not None:
+                self.stats_ready.wait()
+            
+            for user in users:
+                # Get additional user details
+                enriched_user = self._enrich_user_data(user)
+                
+                role = user.get('role', 'end-user')
+                # Map roles to subcategories
+                if role in AGENT_ROLES:
+                    subcategory = 'agents'
+                else:
+                    subcategory = 'end-users'
+                
+                users_by_role[subcategory].append(enriched_user)
+            
             self.console.print(f"✅ Successfully collected {total_users} users", style="bold green")
             return dict(users_by_role)
             
@@ -101,17 +144,7 @@ class UsersCollector:
         Returns:
             Organization information dictionary
         """
-        if not org_id:
-            return {}
-        
-        if org_id not in self.organizations_cache:
-            try:
-                response = self.client.get(f'/organizations/{org_id}.json')
-                self.organizations_cache[org_id] = response.get('organization', {})
-            except ZendeskAPIError:
-                self.organizations_cache[org_id] = {}
-        
-        return self.organizations_cache[org_id]
+        return get_resource(self.client, 'organizations', org_id)
     
     def _get_user_groups(self, user_id: int) -> List[Dict[str, Any]]:
         """Get groups that a user belongs to.
@@ -122,21 +155,59 @@ class UsersCollector:
         Returns:
             List of group information
         """
+        groups = []
+        for group_id in self._get_user_group_ids(user_id):
+            group_info = self._get_group_info(group_id)
+            if group_info:
+                groups.append(group_info)
+        
+        return groups
+    
+    def _load_all_memberships(self) -> bool:
+        """Fill the memberships cache from a single account-wide membership scan.
+        
+        Returns:
+            True if the memberships cache now covers all users, False on API errors
+        """
+        group_ids_by_user = defaultdict(list)
+        
         try:
-            response = self.client.get(f'/users/{user_id}/group_memberships.json')
-            memberships = response.get('group_memberships', [])
-            
-            groups = []
-            for membership in memberships:
+            for membership in self.client.get_paginated('/group_memberships.json', paginate='cursor'):
                 group_id = membership.get('group_id')
                 if group_id:
-                    group_info = self._get_group_info(group_id)
-                    if group_info:
-                        groups.append(group_info)
-            
-            return groups
+                    group_ids_by_user[membership.get('user_id')].append(group_id)
         except ZendeskAPIError:
+            return False
+        
+        self.group_ids_cache = group_ids_by_user
+        self._memberships_complete = True
+        return True
+    
+    def _get_user_group_ids(self, user_id: int) -> List[int]:
+        """Get the IDs of the groups a user belongs to.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            List of group IDs
+        """
+        if user_id in self.group_ids_cache:
+            return self.group_ids_cache[user_id]
+        
+        # Users missing from a full scan have no memberships
+        if self._memberships_complete:
             return []
+        
+        try:
+            response = self.client.get(f'/users/{user_id}/group_memberships.json')
+            memberships = response.get('group_memberships', [])
+            group_ids = [membership['group_id'] for membership in memberships if membership.get('group_id')]
+        except ZendeskAPIError:
+            group_ids = []
+        
+        self.group_ids_cache[user_id] = group_ids
+        return group_ids
     
     def _get_group_info(self, group_id: int) -> Dict[str, Any]:
         """Get group information with caching.
@@ -147,14 +218,7 @@ class UsersCollector:
         Returns:
             Group information dictionary
         """
-        if group_id not in self.groups_cache:
-            try:
-                response = self.client.get(f'/groups/{group_id}.json')
-                self.groups_cache[group_id] = response.get('group', {})
-            except ZendeskAPIError:
-                self.groups_cache[group_id] = {}
-        
-        return self.groups_cache[group_id]
+        return get_resource(self.client, 'groups', group_id)
     
     def _get_user_statistics(self, user_id: int) -> Dict[str, Any]:
         """Get user statistics.
@@ -168,44 +232,68 @@ class UsersCollector:
         if user_id in self.user_stats_cache:
             return self.user_stats_cache[user_id]
         
-        stats = {
+        stats = self._empty_user_statistics()
+        if self._stats_primed:
+            return stats
+        
+        # The count endpoint returns just the total instead of a page of matching tickets
+        queries = {
+            'tickets_requested': f'type:ticket requester:{user_id}',
+            'tickets_assigned': f'type:ticket assignee:{user_id}',
+            'tickets_solved': f'type:ticket assignee:{user_id} status:solved',
+        }
+        for key, query in queries.items():
+            try:
+                response = self.client.get('/search/count.json', {'query': query})
+                stats[key] = response.get('count', 0)
+            except ZendeskAPIError:
+                pass
+        
+        self.user_stats_cache[user_id] = stats
+        return stats
+    
+    def _empty_user_statistics(self) -> Dict[str, int]:
+        """Create zeroed per-user ticket counters.
+        
+        Returns:
+            User statistics dictionary
+        """
+        return {
             'tickets_requested': 0,
             'tickets_assigned': 0,
             'tickets_solved': 0
         }
+    
+    def prime_stats_from_tickets(self, tickets: Iterable[Dict[str, Any]]):
+        """Tally per-user ticket counts from already collected tickets.
         
-        try:
-            # Count requested tickets
-            response = self.client.get('/search.json', {
-                'query': f'type:ticket requester:{user_id}',
-                'type': 'ticket'
-            })
-            stats['tickets_requested'] = response.get('count', 0)
-        except ZendeskAPIError:
-            pass
-        
-        try:
-            # Count assigned tickets
-            response = self.client.get('/search.json', {
-                'query': f'type:ticket assignee:{user_id}',
-                'type': 'ticket'
-            })
-            stats['tickets_assigned'] = response.get('count', 0)
-        except ZendeskAPIError:
-            pass
-        
-        try:
-            # Count solved tickets
-            response = self.client.get('/search.json', {
-                'query': f'type:ticket assignee:{user_id} status:solved',
-                'type': 'ticket'
-            })
-            stats['tickets_solved'] = response.get('count', 0)
-        except ZendeskAPIError:
-            pass
+        The tickets must cover the whole account: afterwards, users without a
+        tally are reported with zero tickets instead of being searched for.
         
-        self.user_stats_cache[user_id] = stats
-        return stats
+        Args:
+            tickets: Every ticket in the account
+        """
+        stats_cache = self.user_stats_cache
+        
+        def stats_for(user_id: int) -> Dict[str, int]:
+            stats = stats_cache.get(user_id)
+            if stats is None:
+                stats = stats_cache[user_id] = self._empty_user_statistics()
+            return stats
+        
+        for ticket in tickets:
+            requester_id = ticket.get('requester_id')
+            if requester_id:
+                stats_for(requester_id)['tickets_requested'] += 1
+            
+            assignee_id = ticket.get('assignee_id')
+            if assignee_id:
+                stats = stats_for(assignee_id)
+                stats['tickets_assigned'] += 1
+                if ticket.get('status') == 'solved':
+                    stats['tickets_solved'] += 1
+        
+        self._stats_primed = True
     
     def export_to_markdown(self, users_by_role: Dict[str, List[Dict[str, Any]]]) -> bool:
         """Export users to markdown files.
@@ -221,38 +309,21 @@ class UsersCollector:
         total_exported = 0
         
         try:
-            with Progress() as progress:
+            with Progress(console=self.console, disable=not self.show_progress) as progress:
                 # Calculate total users for progress
                 total_users = sum(len(users) for users in users_by_role.values())
                 task = progress.add_task("Exporting users...", total=total_users)
                 
+                # Users are rendered here while earlier ones are written by worker threads
+                total_exported += self.formatter.write_files(self._render_users(users_by_role, progress, task))
+                progress.update(task, completed=total_users)
+                
+                # Create index for each role
                 for role, users in users_by_role.items():
-                    self.console.print(f"Exporting {len(users)} {role}...")
-                    
-                    for user in users:
-                        # Prepare context for template
-                        context = self._prepare_user_context(user)
-                        
-                        # Generate markdown content
-                        content = self.formatter.format_user(user, **context)
-                        
-                        # Determine output path
-                        output_path = self.formatter.get_output_path(user, role)
-                        
-                        # Write file
-                        if self.formatter.write_file(content, output_path):
-                            total_exported += 1
-                        
-                        progress.update(task, advance=1)
-                    
-                    # Create index for this role
                     self.formatter.create_index_file(users, role)
                 
                 # Create main index
-                all_users = []
-                for users in users_by_role.values():
-                    all_users.extend(users)
-                self.formatter.create_index_file(all_users)
+                self.formatter.create_index_file(chain.from_iterable(users_by_role.values()))
             
             self.console.print(f"✅ Successfully exported {total_exported} users", style="bold green")
             return True
@@ -261,6 +332,36 @@ class UsersCollector:
             self.console.print(f"❌ Error exporting users: {e}", style="bold red")
             return False
     
+    def _render_users(self, users_by_role: Dict[str, List[Dict[str, Any]]],
+                      progress: Progress, task: TaskID) -> Iterator[Tuple[str, Path]]:
+        """Render users to markdown.
+        
+        Args:
+            users_by_role: Users organized by role
+            progress: Progress display to update
+            task: Progress task for the export
+            
+        Yields:
+            Tuples of (markdown content, output path)
+        """
+        rendered = 0
+        for role, users in users_by_role.items():
+            self.console.print(f"Exporting {len(users)} {role}...")
+            
+            # Generate markdown content (large batches render in worker processes)
+            records = [(user, self._prepare_user_context(user)) for user in users]
+            contents = self.formatter.render_many('user', records)
+            
+            for user, content in zip(users, contents):
+                # Determine output path
+                output_path = self.formatter.get_output_path(user, role)
+                
+                yield content, output_path
+                
+                rendered += 1
+                if rendered % PROGRESS_UPDATE_INTERVAL == 0:
+                    progress.update(task, advance=PROGRESS_UPDATE_INTERVAL)
+    
     def _prepare_user_context(self, user: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare context for user template.
         
@@ -276,9 +377,7 @@ class UsersCollector:
         organization = user.get('organization_info', {})
         if organization:
             context['organization_name'] = organization.get('name')
-            context['organization_file'] = self.formatter.sanitize_filename(
-                f"{organization.get('id', 'unknown')}-{organization.get('name', 'unknown')}"
-            )
+            context['organization_file'] = self.formatter.link_filename(organization)
         else:
             context['organization_name'] = None
             context['organization_file'] = None
@@ -2,13 +2,128 @@
 import os
 import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import unicodedata
+from functools import lru_cache
 
 from src.utils.config import config
 
 
+# Flags for raw file writes; O_BINARY only exists (and matters) on Windows
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Files at least this large are preallocated to limit fragmentation
+_PREALLOCATE_THRESHOLD = 64 * 1024
+
+# Filename clean-up tables, built once; the fixed invalid set is a plain translate
+_INVALID_FILENAME_CHARS = str.maketrans(dict.fromkeys('<>:"/\\|?*', '-'))
+_FILENAME_SEPARATORS = re.compile(r'[-\s]+')
+
+# Directories already created in this process; every file only needs its parent checked once
+_created_dirs: Set[Path] = set()
+
+# Threads used by write_files to overlap independent file writes
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+@lru_cache(maxsize=65536)
+def _sanitize_filename(filename: str, max_length: int) -> str:
+    """Sanitize filename for filesystem compatibility (memoized).
+    
+    Args:
+        filename: Original filename
+        max_length: Maximum filename length
+        
+    Returns:
+        Sanitized filename
+    """
+    # Normalize unicode characters (ASCII is already normalized)
+    if not filename.isascii():
+        filename = unicodedata.normalize('NFKD', filename)
+    
+    # Replace invalid characters
+    filename = filename.translate(_INVALID_FILENAME_CHARS)
+    
+    # Replace multiple spaces/hyphens with single ones
+    filename = _FILENAME_SEPARATORS.sub('-', filename)
+    
+    # Remove leading/trailing hyphens and spaces
+    filename = filename.strip('- ')
+    
+    # Truncate if too long, but preserve extension
+    if len(filename) > max_length:
+        name_part = filename[:max_length-3]
+        filename = name_part + '...'
+    
+    return filename or 'untitled'
+
+
+@lru_cache(maxsize=65536)
+def _format_date(date_string: str, date_format: str) -> str:
+    """Format an ISO date string for display (memoized).
+    
+    Args:
+        date_string: ISO date string
+        date_format: strftime format
+        
+    Returns:
+        Formatted date string, or the input if it can't be parsed
+    """
+    try:
+        # Zendesk timestamps are UTC with a trailing 'Z'
+        iso_string = date_string[:-1] + '+00:00' if date_string.endswith('Z') else date_string
+        date_obj = datetime.fromisoformat(iso_string)
+        return date_obj.strftime(date_format)
+    except (ValueError, AttributeError):
+        return date_string
+
+
+def _markdown_filename(filename: str) -> str:
+    """Sanitize a filename and add the .md extension.
+    
+    Args:
+        filename: Filename without sanitization
+        
+    Returns:
+        Markdown filename
+    """
+    filename = _sanitize_filename(filename, 100)
+    if not filename.endswith('.md'):
+        filename += '.md'
+    
+    return filename
+
+
+@lru_cache(maxsize=65536)
+def _default_filename(item_id: Any, title: Any) -> str:
+    """Build the default filename for an item from its ID and title (memoized).
+    
+    Args:
+        item_id: Item ID
+        title: Item title, subject or name
+        
+    Returns:
+        Markdown filename
+    """
+    return _markdown_filename(f"{item_id}-{title}")
+
+
+@lru_cache(maxsize=65536)
+def _link_filename(record_id: Any, name: Any) -> str:
+    """Build the filename a user or organization page is linked by (memoized).
+    
+    Args:
+        record_id: Record ID
+        name: Record name
+        
+    Returns:
+        Sanitized filename
+    """
+    return _sanitize_filename(f"{record_id}-{name}", 100)
+
+
 class BaseExporter:
     """Base class for exporting Zendesk data to files."""
     
@@ -20,21 +135,29 @@ class BaseExporter:
         """
         self.category = category
         self.output_config = config.get_output_config()
+        self._date_format = self.output_config['date_format']
         self.category_config = config.get_category_config(category)
         self.base_directory = Path(self.output_config['base_directory'])
         self.category_directory = self.base_directory / self.category_config.get('directory', category)
         
+        # Subcategory directory paths built once; items reuse them for every output path
+        self._subcategory_directories: Dict[str, Path] = {
+            subcat: self.category_directory / subcat
+            for subcat in self.category_config.get('subcategories', [])
+        }
+        
         # Ensure output directories exist
         self._create_directories()
     
     def _create_directories(self):
         """Create necessary output directories."""
-        self.category_directory.mkdir(parents=True, exist_ok=True)
-        
-        # Create subdirectories if configured
-        subcategories = self.category_config.get('subcategories', [])
-        for subcat in subcategories:
-            (self.category_directory / subcat).mkdir(parents=True, exist_ok=True)
+        # The category directory plus configured subdirectories, registered as created
+        # so writes into them skip their own mkdir
+        directories = [self.category_directory, *self._subcategory_directories.values()]
+        for directory in directories:
+            if directory not in _created_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                _created_dirs.add(directory)
     
     def sanitize_filename(self, filename: str, max_length: int = 100) -> str:
         """Sanitize filename for filesystem compatibility.
@@ -46,24 +169,8 @@ class BaseExporter:
         Returns:
             Sanitized filename
         """
-        # Normalize unicode characters
-        filename = unicodedata.normalize('NFKD', filename)
-        
-        # Replace invalid characters
-        filename = re.sub(r'[<>:"/\\|?*]', '-', filename)
-        
-        # Replace multiple spaces/hyphens with single ones
-        filename = re.sub(r'[-\s]+', '-', filename)
-        
-        # Remove leading/trailing hyphens and spaces
-        filename = filename.strip('- ')
-        
-        # Truncate if too long, but preserve extension
-        if len(filename) > max_length:
-            name_part = filename[:max_length-3]
-            filename = name_part + '...'
-        
-        return filename or 'untitled'
+        # The same section/user/organization names recur across many items
+        return _sanitize_filename(filename, max_length)
     
     def generate_filename(self, item: Dict[str, Any], template: str = None) -> str:
         """Generate filename for an item.
@@ -82,18 +189,36 @@ class BaseExporter:
             except (KeyError, ValueError):
                 # Fallback to default if template fails
                 filename = f"{item.get('id', 'unknown')}-{item.get('title', item.get('name', 'untitled'))}"
-        else:
-            # Default filename generation
-            item_id = item.get('id', 'unknown')
-            title = item.get('title') or item.get('subject') or item.get('name') or 'untitled'
-            filename = f"{item_id}-{title}"
+            return _markdown_filename(filename)
         
-        # Sanitize and add .md extension
-        filename = self.sanitize_filename(filename)
-        if not filename.endswith('.md'):
-            filename += '.md'
+        # Default filename generation; items are linked from indexes and other records
+        # as well, so the same (id, title) pair is named many times
+        item_id = item.get('id', 'unknown')
+        title = item.get('title') or item.get('subject') or item.get('name') or 'untitled'
+        return _default_filename(item_id, title)
+    
+    def link_filename(self, record: Dict[str, Any]) -> str:
+        """Get the filename a user, organization or section page is linked by.
+        
+        Args:
+            record: Record data
+            
+        Returns:
+            Sanitized filename
+        """
+        # The same users and organizations are linked from many records
+        return _link_filename(record.get('id', 'unknown'), record.get('name', 'unknown'))
+    
+    def build_filename_index(self, records: Iterable[Dict[str, Any]]) -> Dict[Any, str]:
+        """Map record IDs to the filenames their pages are linked by.
         
-        return filename
+        Args:
+            records: User or organization records
+            
+        Returns:
+            Dictionary of record ID to sanitized filename
+        """
+        return {record.get('id'): self.link_filename(record) for record in records}
     
     def get_output_path(self, item: Dict[str, Any], subcategory: str = None, filename: str = None) -> Path:
         """Get output path for an item.
@@ -110,7 +235,11 @@ class BaseExporter:
             filename = self.generate_filename(item)
         
         if subcategory:
-            return self.category_directory / subcategory / filename
+            directory = self._subcategory_directories.get(subcategory)
+            if directory is None:
+                # Subcategories outside the config (e.g., roles, sections) are cached on first use
+                directory = self._subcategory_directories[subcategory] = self.category_directory / subcategory
+            return directory / filename
         else:
             return self.category_directory / filename
     
@@ -124,22 +253,94 @@ class BaseExporter:
         Returns:
             True if successful, False otherwise
         """
+        if not self._ensure_directory(filepath):
+            return False
+        
+        return self._write_bytes(content, filepath)
+    
+    def write_files(self, files: Iterable[Tuple[str, Path]]) -> int:
+        """Write many files, overlapping the writes on a thread pool.
+        
+        The iterable is consumed lazily, so a generator that renders content keeps
+        rendering while earlier files are being written.
+        
+        Args:
+            files: Iterable of (content, filepath) pairs
+            
+        Returns:
+            Number of files written successfully
+        """
+        futures = []
+        
+        with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+            for content, filepath in files:
+                if not self._ensure_directory(filepath):
+                    continue
+                
+                futures.append(executor.submit(self._write_bytes, content, filepath))
+        
+        return sum(1 for future in futures if future.result())
+    
+    def _ensure_directory(self, filepath: Path) -> bool:
+        """Create the directory of a file unless this process already created it.
+        
+        Args:
+            filepath: Path about to be written
+            
+        Returns:
+            True if the directory exists, False otherwise
+        """
+        parent = filepath.parent
+        if parent in _created_dirs:
+            return True
+        
         try:
-            # Ensure directory exists
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+            parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            print(f"Error writing file {filepath}: {e}")
+            return False
+        
+        _created_dirs.add(parent)
+        return True
+    
+    def _write_bytes(self, content: str, filepath: Path) -> bool:
+        """Write content to a file whose directory already exists.
+        
+        Args:
+            content: File content
+            filepath: Path to write to
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Encode once and write through the fd, skipping the text I/O layer
+            data = content.encode('utf-8')
+            fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+            try:
+                if len(data) >= _PREALLOCATE_THRESHOLD and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, len(data))
+                    except OSError:
+                        # Not supported by every filesystem; the write still works
+                        pass
+                
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+            finally:
+                os.close(fd)
             return True
         except Exception as e:
             print(f"Error writing file {filepath}: {e}")
             return False
     
-    def create_index_file(self, items: List[Dict[str, Any]], subcategory: str = None) -> bool:
+    def create_index_file(self, items: Iterable[Dict[str, Any]], subcategory: str = None) -> bool:
         """Create index file for a category or subcategory.
         
         Args:
-            items: List of items to include in index
+            items: Items to include in index (any iterable; it is consumed once)
             subcategory: Subcategory name (optional)
             
         Returns:
@@ -157,51 +358,53 @@ class BaseExporter:
         
         return self.write_file(content, index_path)
     
-    def _generate_index_content(self, items: List[Dict[str, Any]], title: str, subcategory: str = None) -> str:
+    def _generate_index_content(self, items: Iterable[Dict[str, Any]], title: str, subcategory: str = None) -> str:
         """Generate content for index file.
         
         Args:
-            items: List of items
+            items: Items to include (any iterable; it is consumed once)
             title: Index title
             subcategory: Subcategory name
             
         Returns:
             Markdown content for index
         """
-        content = f"# {title}\n\n"
-        content += f"Generated on: {datetime.now().strftime(self.output_config['date_format'])}\n"
-        content += f"Total items: {len(items)}\n\n"
+        # Sorting materializes the items once, so callers can pass chained iterables
+        items = sorted(items, key=lambda x: x.get('created_at', x.get('id', '')))
+        
+        # Collect the pieces and join once instead of growing one string per item
+        parts = [
+            f"# {title}\n\n",
+            f"Generated on: {datetime.now().strftime(self.output_config['date_format'])}\n",
+            f"Total items: {len(items)}\n\n",
+        ]
         
         if not items:
-            content += "No items found.\n"
-            return content
+            parts.append("No items found.\n")
+            return ''.join(parts)
         
         # Group items by some criteria if needed
-        content += "## Items\n\n"
+        parts.append("## Items\n\n")
         
-        for item in sorted(items, key=lambda x: x.get('created_at', x.get('id', ''))):
-            item_id = item.get('id', 'unknown')
+        generate_filename = self.generate_filename
+        append = parts.append
+        for item in items:
             title = item.get('title') or item.get('subject') or item.get('name') or 'Untitled'
-            filename = self.generate_filename(item)
             
-            # Create relative link
-            if subcategory:
-                link = f"./{filename}"
-            else:
-                link = f"./{filename}"
-            
-            # Add item to index
-            content += f"- [{title}]({link})"
+            # Index files sit next to the items they list
+            append(f"- [{title}](./{generate_filename(item)})")
             
             # Add metadata
-            if item.get('status'):
-                content += f" - Status: {item['status']}"
-            if item.get('created_at'):
-                content += f" - Created: {item['created_at'][:10]}"  # Date only
+            status = item.get('status')
+            if status:
+                append(f" - Status: {status}")
+            created_at = item.get('created_at')
+            if created_at:
+                append(f" - Created: {created_at[:10]}")  # Date only
             
-            content += "\n"
+            append("\n")
         
-        return content
+        return ''.join(parts)
     
     def get_relative_link(self, from_path: Path, to_path: Path) -> str:
         """Get relative link between two paths.
@@ -213,6 +416,17 @@ class BaseExporter:
         Returns:
             Relative link string
         """
+        # Exported files share the output tree, so the link follows from the path parts
+        # alone; relpath would resolve both paths against the working directory each call
+        base_parts = self.base_directory.parts
+        from_parts = from_path.parent.parts
+        to_parts = to_path.parts
+        if from_parts[:len(base_parts)] == base_parts and to_parts[:len(base_parts)] == base_parts:
+            common = len(base_parts)
+            while common < len(from_parts) and common < len(to_parts) and from_parts[common] == to_parts[common]:
+                common += 1
+            return '/'.join(['..'] * (len(from_parts) - common) + list(to_parts[common:])) or '.'
+        
         try:
             rel_path = os.path.relpath(to_path, from_path.parent)
             # Convert Windows paths to Unix-style for URLs
@@ -232,13 +446,10 @@ class BaseExporter:
         """
         if not date_string:
             return "N/A"
-        
-        try:
-            # Parse ISO date
-            date_obj = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            return date_obj.strftime(self.output_config['date_format'])
-        except (ValueError, AttributeError):
+        if not isinstance(date_string, str):
             return date_string
+        
+        return _format_date(date_string, self._date_format)
     
     def format_list_as_markdown(self, items: List[str], bullet_type: str = "-") -> str:
         """Format list of items as markdown.
@@ -269,13 +480,16 @@ class BaseExporter:
             return "No data available."
         
         # Create header
-        table = "| " + " | ".join(headers) + " |\n"
-        table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
+        column_count = len(headers)
+        lines = [
+            "| " + " | ".join(headers) + " |\n",
+            "| " + " | ".join(["---"] * column_count) + " |\n",
+        ]
         
         # Add rows
         for row in rows:
             # Ensure row has same number of columns as headers
-            padded_row = row + [""] * (len(headers) - len(row))
-            table += "| " + " | ".join(str(cell) for cell in padded_row[:len(headers)]) + " |\n"
+            padded_row = row + [""] * (column_count - len(row))
+            lines.append("| " + " | ".join([str(cell) for cell in padded_row[:column_count]]) + " |\n")
         
-        return table 
\ No newline at end of file
+        return ''.join(lines) 
\ No newline at end of file
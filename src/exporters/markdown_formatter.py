@@ -1,16 +1,125 @@
 """Markdown formatter for Zendesk data types."""
-from typing import Dict, Any, List, Optional
-from jinja2 import Template, Environment, DictLoader
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from jinja2 import Template, Environment, DictLoader, FileSystemBytecodeCache
+from jinja2.filters import do_title
 import html
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
 
 from src.exporters.base_exporter import BaseExporter
+from src.utils.config import config
+
+
+# Below this many records, worker start-up costs more than parallel rendering saves
+PROCESS_RENDER_THRESHOLD = 500
+
+# Records sent to a render worker per task
+PROCESS_RENDER_CHUNKSIZE = 64
+
+
+# HTML to markdown rules, applied in order
+_HTML_TO_MARKDOWN_RULES = [
+    # Headers
+    (r'<h1[^>]*>(.*?)</h1>', r'# \1'),
+    (r'<h2[^>]*>(.*?)</h2>', r'## \1'),
+    (r'<h3[^>]*>(.*?)</h3>', r'### \1'),
+    (r'<h4[^>]*>(.*?)</h4>', r'#### \1'),
+    (r'<h5[^>]*>(.*?)</h5>', r'##### \1'),
+    (r'<h6[^>]*>(.*?)</h6>', r'###### \1'),
+    
+    # Text formatting
+    (r'<strong[^>]*>(.*?)</strong>', r'**\1**'),
+    (r'<b[^>]*>(.*?)</b>', r'**\1**'),
+    (r'<em[^>]*>(.*?)</em>', r'*\1*'),
+    (r'<i[^>]*>(.*?)</i>', r'*\1*'),
+    (r'<code[^>]*>(.*?)</code>', r'`\1`'),
+    
+    # Lists
+    (r'<ul[^>]*>', ''),
+    (r'</ul>', ''),
+    (r'<ol[^>]*>', ''),
+    (r'</ol>', ''),
+    (r'<li[^>]*>(.*?)</li>', r'- \1'),
+    
+    # Links
+    (r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', r'[\2](\1)'),
+    
+    # Line breaks and paragraphs
+    (r'<br[^>]*/?>', '\n'),
+    (r'<p[^>]*>', '\n'),
+    (r'</p>', '\n'),
+    
+    # Divs (just remove tags)
+    (r'<div[^>]*>', ''),
+    (r'</div>', ''),
+    
+    # Remove any remaining HTML tags
+    (r'<[^>]+>', ''),
+]
+
+# Compiled once, each with the start of the tag it matches so bodies without that tag skip its pass
+_HTML_TO_MARKDOWN = tuple(
+    (re.match(r'</?\w*', pattern).group().lower(), re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in _HTML_TO_MARKDOWN_RULES
+)
+
+
+_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+_SPACES_RE = re.compile(r'[ \t]+')
+
+
+def _field(record: Dict[str, Any], key: str) -> str:
+    """Render a record field the way a template would (missing fields render empty).
+    
+    Args:
+        record: Record data
+        key: Field name
+        
+    Returns:
+        Field value as text
+    """
+    value = record.get(key, '')
+    return value if isinstance(value, str) else str(value)
+
+
+@lru_cache(maxsize=8)
+def _formatter_for_kind(category: str) -> 'MarkdownFormatter':
+    """Get the formatter for a category, built once per process.
+    
+    Args:
+        category: Data category
+        
+    Returns:
+        Markdown formatter instance
+    """
+    return MarkdownFormatter(category)
+
+
+def _render_in_worker(job: Tuple[str, str, Dict[str, Any], Dict[str, Any]]) -> str:
+    """Render one record inside a worker process.
+    
+    Args:
+        job: Tuple of (category, kind, item, context)
+        
+    Returns:
+        Formatted markdown content
+    """
+    category, kind, item, context = job
+    return _formatter_for_kind(category).render(kind, item, context)
 
 
 class MarkdownFormatter(BaseExporter):
     """Formatter for converting Zendesk data to markdown."""
     
+    # Environment and compiled templates shared by every category, built by the first formatter
+    jinja_env: Optional[Environment] = None
+    _templates: Dict[str, Template] = {}
+    
     def __init__(self, category: str):
         """Initialize markdown formatter.
         
@@ -18,10 +127,49 @@ class MarkdownFormatter(BaseExporter):
             category: Data category
         """
         super().__init__(category)
-        self.jinja_env = Environment(loader=DictLoader(self._get_templates()))
-        self.jinja_env.filters['format_date'] = self.format_date
-        self.jinja_env.filters['format_html'] = self._format_html_to_markdown
-        self.jinja_env.filters['format_list'] = self.format_list_as_markdown
+        if MarkdownFormatter.jinja_env is None:
+            self._compile_templates()
+    
+    def _compile_templates(self):
+        """Build the shared Jinja2 environment and compile every template once per process.
+        
+        The filters only depend on the global output settings, so binding them to the
+        first formatter serves every category.
+        """
+        # Compiled templates are kept on disk between runs (keyed by source checksum)
+        bytecode_directory = Path(config.get_cache_config()['directory']) / 'jinja'
+        bytecode_directory.mkdir(parents=True, exist_ok=True)
+        
+        # Templates never change at runtime, so skip Jinja's up-to-date checks and cache eviction
+        templates = self._get_templates()
+        jinja_env = Environment(
+            loader=DictLoader(templates),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=FileSystemBytecodeCache(str(bytecode_directory))
+        )
+        jinja_env.filters['format_date'] = self.format_date
+        jinja_env.filters['format_html'] = self._format_html_to_markdown
+        jinja_env.filters['format_list'] = self.format_list_as_markdown
+        jinja_env.filters['link_file'] = self.link_filename
+        jinja_env.filters['format_fields_table'] = self._format_fields_table
+        
+        MarkdownFormatter._templates = {name: jinja_env.get_template(name) for name in templates}
+        MarkdownFormatter.jinja_env = jinja_env
+    
+    @classmethod
+    def for_kind(cls, category: str) -> 'MarkdownFormatter':
+        """Get the shared formatter for a category.
+        
+        Building a formatter loads the category settings, so collectors reuse one per category.
+        
+        Args:
+            category: Data category
+            
+        Returns:
+            Markdown formatter instance
+        """
+        return _formatter_for_kind(category)
     
     def _get_templates(self) -> Dict[str, str]:
         """Get Jinja2 templates for different data types.
@@ -38,16 +186,16 @@ class MarkdownFormatter(BaseExporter):
 **Created:** {{ ticket.created_at | format_date }}  
 **Updated:** {{ ticket.updated_at | format_date }}  
 {% if ticket.due_at %}**Due:** {{ ticket.due_at | format_date }}  {% endif %}
-**Requester:** [{{ requester_name }}](../users/{{ requester_file }})  
-**Assignee:** {% if assignee_name %}[{{ assignee_name }}](../users/{{ assignee_file }}){% else %}Unassigned{% endif %}  
-{% if organization_name %}**Organization:** [{{ organization_name }}](../organizations/{{ organization_file }})  {% endif %}
-{% if ticket.group_id %}**Group:** {{ group_name }}  {% endif %}
+**Requester:** [{{ ticket.requester_info.name | default('Unknown') }}](../users/{{ ticket.requester_info | link_file }})  
+**Assignee:** {% if ticket.assignee_info.name %}[{{ ticket.assignee_info.name }}](../users/{{ ticket.assignee_info | link_file }}){% else %}Unassigned{% endif %}  
+{% if ticket.organization_info.name %}**Organization:** [{{ ticket.organization_info.name }}](../organizations/{{ ticket.organization_info | link_file }})  {% endif %}
+{% if ticket.group_id %}**Group:** {% if ticket.group_info %}{{ ticket.group_info.name | default('Unknown') }}{% else %}None{% endif %}  {% endif %}
 
 ## Description
 {{ ticket.description | format_html }}
 
-{% if comments %}## Comments
-{% for comment in comments %}
+{% if ticket.comments %}## Comments
+{% for comment in ticket.comments %}
 ### Comment by {{ comment.author_name }} - {{ comment.created_at | format_date }}
 {{ comment.html_body | format_html }}
 {% if comment.attachments %}
@@ -62,7 +210,7 @@ class MarkdownFormatter(BaseExporter):
 {% endif %}
 
 {% if custom_fields %}## Custom Fields
-{{ custom_fields_table }}
+{{ ticket.custom_fields_processed | format_fields_table }}
 {% endif %}
 
 {% if ticket.tags %}## Tags
@@ -143,7 +291,7 @@ class MarkdownFormatter(BaseExporter):
 {% endif %}
 
 {% if users %}## Users ({{ users | length }})
-{% for user in users[:10] %}- [{{ user.name }}](../users/{{ user.filename }}) - {{ user.role | title }}
+{% for user in users[:10] %}- [{{ user.name }}](../users/{{ filenames[user.id] }}) - {{ user.role | title }}
 {% endfor %}
 {% if users | length > 10 %}
 ... and {{ (users | length) - 10 }} more users
@@ -172,43 +320,6 @@ class MarkdownFormatter(BaseExporter):
 {% for attachment in article.attachments %}
 - [{{ attachment.file_name }}]({{ attachment.content_url }})
 {% endfor %}
-{% endif %}''',
-
-            'macro': '''# {{ macro.title }}
-
-**Active:** {{ "Yes" if macro.active else "No" }}  
-**Created:** {{ macro.created_at | format_date }}  
-**Updated:** {{ macro.updated_at | format_date }}  
-**Position:** {{ macro.position }}  
-
-{% if macro.description %}## Description
-{{ macro.description }}
-{% endif %}
-
-## Actions
-{% for action in macro.actions %}
-### {{ action.field | title }}
-**Value:** {{ action.value }}  
-{% endfor %}
-
-{% if macro.restriction %}## Restrictions
-{{ macro.restriction }}
-{% endif %}''',
-
-            'group': '''# {{ group.name }}
-
-**Created:** {{ group.created_at | format_date }}  
-**Updated:** {{ group.updated_at | format_date }}  
-**Default:** {{ "Yes" if group.default else "No" }}  
-**Deleted:** {{ "Yes" if group.deleted else "No" }}  
-
-{% if group.description %}## Description
-{{ group.description }}
-{% endif %}
-
-{% if agents %}## Agents ({{ agents | length }})
-{% for agent in agents %}- [{{ agent.name }}](../users/{{ agent.filename }})
-{% endfor %}
 {% endif %}'''
         }
     
@@ -224,70 +335,87 @@ class MarkdownFormatter(BaseExporter):
         if not html_content:
             return ""
         
-        # Unescape HTML entities
-        content = html.unescape(html_content)
-        
-        # Convert common HTML tags to markdown
-        conversions = [
-            # Headers
-            (r'<h1[^>]*>(.*?)</h1>', r'# \1'),
-            (r'<h2[^>]*>(.*?)</h2>', r'## \1'),
-            (r'<h3[^>]*>(.*?)</h3>', r'### \1'),
-            (r'<h4[^>]*>(.*?)</h4>', r'#### \1'),
-            (r'<h5[^>]*>(.*?)</h5>', r'##### \1'),
-            (r'<h6[^>]*>(.*?)</h6>', r'###### \1'),
-            
-            # Text formatting
-            (r'<strong[^>]*>(.*?)</strong>', r'**\1**'),
-            (r'<b[^>]*>(.*?)</b>', r'**\1**'),
-            (r'<em[^>]*>(.*?)</em>', r'*\1*'),
-            (r'<i[^>]*>(.*?)</i>', r'*\1*'),
-            (r'<code[^>]*>(.*?)</code>', r'`\1`'),
-            
-            # Lists
-            (r'<ul[^>]*>', ''),
-            (r'</ul>', ''),
-            (r'<ol[^>]*>', ''),
-            (r'</ol>', ''),
-            (r'<li[^>]*>(.*?)</li>', r'- \1'),
-            
-            # Links
-            (r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', r'[\2](\1)'),
-            
-            # Line breaks and paragraphs
-            (r'<br[^>]*/?>', '\n'),
-            (r'<p[^>]*>', '\n'),
-            (r'</p>', '\n'),
-            
-            # Divs (just remove tags)
-            (r'<div[^>]*>', ''),
-            (r'</div>', ''),
-            
-            # Remove any remaining HTML tags
-            (r'<[^>]+>', ''),
-        ]
+        # Unescape HTML entities (plain text usually has none)
+        content = html.unescape(html_content) if '&' in html_content else html_content
         
-        for pattern, replacement in conversions:
-            content = re.sub(pattern, replacement, content, flags=re.IGNORECASE | re.MULTILINE)
+        # Convert common HTML tags to markdown, in rule order (plain text has none)
+        if '<' in content:
+            lowered = content.lower()
+            for tag_start, pattern, replacement in _HTML_TO_MARKDOWN:
+                if tag_start in lowered:
+                    content, count = pattern.subn(replacement, content)
+                    if count:
+                        # Removing a tag can join the text around it into another one
+                        lowered = content.lower()
         
         # Clean up multiple newlines and spaces
-        content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
-        content = re.sub(r'[ \t]+', ' ', content)
+        content = _BLANK_LINES_RE.sub('\n\n', content)
+        content = _SPACES_RE.sub(' ', content)
         
         return content.strip()
     
+    def render(self, kind: str, item: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> str:
+        """Format an item with the formatter for its kind.
+        
+        Args:
+            kind: Item kind (e.g., 'macro', 'group', 'organization')
+            item: Item data
+            context: Additional template context
+            
+        Returns:
+            Formatted markdown content
+        """
+        return getattr(self, f'format_{kind}')(item, **(context or {}))
+    
+    def render_many(self, kind: str, records: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Iterator[str]:
+        """Format many items, spreading large batches over worker processes.
+        
+        Template rendering is CPU-bound, so threads can't run it in parallel.
+        Small batches are rendered in-process.
+        
+        Args:
+            kind: Item kind (e.g., 'macro', 'group', 'organization')
+            records: List of (item, context) pairs
+            
+        Yields:
+            Formatted markdown content, in the order of records
+        """
+        if len(records) < PROCESS_RENDER_THRESHOLD or (os.cpu_count() or 1) < 2:
+            for item, context in records:
+                yield self.render(kind, item, context)
+            return
+        
+        # Spawn rather than fork: collectors may run in threads (e.g., the all command)
+        jobs = ((self.category, kind, item, context) for item, context in records)
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+            yield from executor.map(_render_in_worker, jobs, chunksize=PROCESS_RENDER_CHUNKSIZE)
+    
+    def _format_fields_table(self, fields: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Format processed custom fields as a markdown table.
+        
+        Args:
+            fields: Field title to value mapping
+            
+        Returns:
+            Markdown table, or None if there are no fields
+        """
+        if not fields:
+            return None
+        return self.format_table(['Field', 'Value'], [[k, str(v)] for k, v in fields.items()])
+    
     def format_ticket(self, ticket: Dict[str, Any], **context) -> str:
         """Format ticket data as markdown.
         
+        Related records are read from the enriched ticket by the template itself.
+        
         Args:
-            ticket: Ticket data
-            **context: Additional context (comments, custom_fields, etc.)
+            ticket: Enriched ticket data
+            **context: Additional context
             
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('ticket')
-        return template.render(ticket=ticket, **context)
+        return self._templates['ticket'].render(ticket=ticket, **context)
     
     def format_user(self, user: Dict[str, Any], **context) -> str:
         """Format user data as markdown.
@@ -299,8 +427,7 @@ class MarkdownFormatter(BaseExporter):
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('user')
-        return template.render(user=user, **context)
+        return self._templates['user'].render(user=user, **context)
     
     def format_organization(self, organization: Dict[str, Any], **context) -> str:
         """Format organization data as markdown.
@@ -312,8 +439,7 @@ class MarkdownFormatter(BaseExporter):
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('organization')
-        return template.render(organization=organization, **context)
+        return self._templates['organization'].render(organization=organization, **context)
     
     def format_article(self, article: Dict[str, Any], **context) -> str:
         """Format knowledge base article as markdown.
@@ -325,8 +451,7 @@ class MarkdownFormatter(BaseExporter):
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('article')
-        return template.render(article=article, **context)
+        return self._templates['article'].render(article=article, **context)
     
     def format_macro(self, macro: Dict[str, Any], **context) -> str:
         """Format macro data as markdown.
@@ -338,8 +463,27 @@ class MarkdownFormatter(BaseExporter):
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('macro')
-        return template.render(macro=macro, **context)
+        # Simple enough to format directly, skipping the template machinery
+        parts = [
+            f"# {_field(macro, 'title')}\n\n",
+            f"**Active:** {'Yes' if macro.get('active') else 'No'}  \n",
+            f"**Created:** {self.format_date(macro.get('created_at'))}  \n",
+            f"**Updated:** {self.format_date(macro.get('updated_at'))}  \n",
+            f"**Position:** {_field(macro, 'position')}  \n\n",
+        ]
+        
+        if macro.get('description'):
+            parts.append(f"## Description\n{macro['description']}\n")
+        
+        parts.append("\n\n## Actions\n")
+        for action in macro.get('actions') or ():
+            parts.append(f"\n### {do_title(_field(action, 'field'))}\n**Value:** {_field(action, 'value')}  \n")
+        parts.append("\n\n")
+        
+        if macro.get('restriction'):
+            parts.append(f"## Restrictions\n{macro['restriction']}\n")
+        
+        return ''.join(parts)
     
     def format_group(self, group: Dict[str, Any], **context) -> str:
         """Format group data as markdown.
@@ -351,5 +495,25 @@ class MarkdownFormatter(BaseExporter):
         Returns:
             Formatted markdown content
         """
-        template = self.jinja_env.get_template('group')
-        return template.render(group=group, **context) 
\ No newline at end of file
+        # Simple enough to format directly, skipping the template machinery
+        parts = [
+            f"# {_field(group, 'name')}\n\n",
+            f"**Created:** {self.format_date(group.get('created_at'))}  \n",
+            f"**Updated:** {self.format_date(group.get('updated_at'))}  \n",
+            f"**Default:** {'Yes' if group.get('default') else 'No'}  \n",
+            f"**Deleted:** {'Yes' if group.get('deleted') else 'No'}  \n\n",
+        ]
+        
+        if group.get('description'):
+            parts.append(f"## Description\n{group['description']}\n")
+        parts.append("\n\n")
+        
+        agents = context.get('agents')
+        if agents:
+            filenames = context.get('filenames', {})
+            parts.append(f"## Agents ({len(agents)})\n")
+            for agent in agents:
+                parts.append(f"- [{_field(agent, 'name')}](../users/{filenames.get(agent.get('id'), '')})\n")
+            parts.append("\n")
+        
+        return ''.join(parts) 
\ No newline at end of file
@@ -1,10 +1,22 @@
 """Configuration management for Zendesk scraper."""
 import os
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 
+try:
+    # libyaml's C parser, when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# ${VAR} placeholders substituted from the environment
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
 
 class Config:
     """Configuration manager that loads settings from environment variables and YAML files."""
@@ -18,6 +30,10 @@ class Config:
         self.config_path = Path(config_path)
         self._config = {}
         self._load_config()
+        
+        # Every dotted key resolved up front; settings don't change after loading
+        self._flat: Dict[str, Any] = {}
+        self._flatten(self._config, '')
     
     def _load_config(self):
         """Load configuration from environment variables and YAML file."""
@@ -30,7 +46,7 @@ class Config:
                 yaml_content = f.read()
                 # Replace environment variables in YAML content
                 yaml_content = self._substitute_env_vars(yaml_content)
-                self._config = yaml.safe_load(yaml_content)
+                self._config = yaml.load(yaml_content, Loader=_YamlLoader)
         else:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
     
@@ -43,13 +59,28 @@ class Config:
         Returns:
             Content with environment variables substituted
         """
-        import re
-        
         def replace_var(match):
             var_name = match.group(1)
             return os.getenv(var_name, match.group(0))
         
-        return re.sub(r'\$\{([^}]+)\}', replace_var, content)
+        return _ENV_VAR_RE.sub(replace_var, content)
+    
+    def _flatten(self, section: Any, prefix: str):
+        """Index a configuration section, and every section nested in it, by dotted key.
+        
+        Args:
+            section: Configuration mapping
+            prefix: Dotted key of the section ('' for the root)
+        """
+        if not isinstance(section, dict):
+            return
+        
+        for name, value in section.items():
+            if not isinstance(name, str):
+                continue
+            key = f'{prefix}{name}'
+            self._flat[key] = value
+            self._flatten(value, f'{key}.')
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key.
@@ -61,16 +92,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def get_zendesk_config(self) -> Dict[str, str]:
         """Get Zendesk API configuration.
@@ -105,7 +127,8 @@ class Config:
         return {
             'requests_per_minute': self.get('rate_limiting.requests_per_minute', 700),
             'retry_attempts': self.get('rate_limiting.retry_attempts', 3),
-            'backoff_factor': self.get('rate_limiting.backoff_factor', 2)
+            'backoff_factor': self.get('rate_limiting.backoff_factor', 2),
+            'max_concurrent_requests': self.get('rate_limiting.max_concurrent_requests', 8)
         }
     
     def get_output_config(self) -> Dict[str, Any]:
@@ -120,6 +143,17 @@ class Config:
             'categories': self.get('categories', {})
         }
     
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get cache configuration.
+        
+        Returns:
+            Dictionary with cache settings
+        """
+        return {
+            'directory': self.get('cache.directory', 'output/.cache'),
+            'ttl_days': self.get('cache.ttl_days', 7)
+        }
+    
     def get_category_config(self, category: str) -> Dict[str, Any]:
         """Get configuration for a specific category.
         
@@ -132,5 +166,18 @@ class Config:
         return self.get(f'categories.{category}', {})
 
 
+@lru_cache(maxsize=None)
+def get_config(config_path: str = "config/config.yaml") -> Config:
+    """Get the configuration for a file, parsed once per process.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        
+    Returns:
+        Configuration manager
+    """
+    return Config(config_path)
+
+
 # Global configuration instance
-config = Config() 
\ No newline at end of file
+config = get_config()
@@ -0,0 +1,6 @@
+"""Shared Rich console for CLI and collector output."""
+from rich.console import Console
+
+
+# One console for the whole process: creating a Console probes the terminal each time
+console = Console()
@@ -0,0 +1,120 @@
+"""Persistent key/value cache backed by SQLite."""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import orjson
+
+
+class DiskCache:
+    """Stores JSON-serializable values on disk so lookups survive across runs.
+    
+    Entries older than the TTL are treated as missing so they get refreshed.
+    """
+    
+    def __init__(self, path: Path, ttl_seconds: Optional[float] = None):
+        """Initialize disk cache.
+        
+        Args:
+            path: SQLite database file
+            ttl_seconds: Maximum entry age before it is ignored (None keeps entries forever)
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries '
+            '(key TEXT PRIMARY KEY, fetched_at REAL NOT NULL, value BLOB NOT NULL)'
+        )
+        self._conn.commit()
+    
+    def _min_fetched_at(self) -> float:
+        """Get the oldest timestamp still considered fresh.
+        
+        Returns:
+            Unix timestamp
+        """
+        if self.ttl_seconds is None:
+            return 0.0
+        return time.time() - self.ttl_seconds
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self.lock:
+            row = self._conn.execute(
+                'SELECT value FROM entries WHERE key = ? AND fetched_at >= ?',
+                (str(key), self._min_fetched_at())
+            ).fetchone()
+        
+        return orjson.loads(row[0]) if row else None
+    
+    def get_many(self, keys: Iterable[Any]) -> Dict[str, Any]:
+        """Get several cached values at once.
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Dictionary of key (as string) to value for fresh entries only
+        """
+        keys = [str(key) for key in keys]
+        found = {}
+        min_fetched_at = self._min_fetched_at()
+        
+        with self.lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f'SELECT key, value FROM entries WHERE key IN ({placeholders}) AND fetched_at >= ?',
+                    (*chunk, min_fetched_at)
+                )
+                for key, value in rows:
+                    found[key] = orjson.loads(value)
+        
+        return found
+    
+    def set(self, key: Any, value: Any):
+        """Store a value.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        self.set_many([(key, value)])
+    
+    def set_many(self, items: Iterable[Tuple[Any, Any]]):
+        """Store several values in one transaction.
+        
+        Args:
+            items: Iterable of (key, value) pairs
+        """
+        now = time.time()
+        rows = [(str(key), now, orjson.dumps(value)) for key, value in items]
+        if not rows:
+            return
+        
+        with self.lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO entries (key, fetched_at, value) VALUES (?, ?, ?)',
+                rows
+            )
+            self._conn.commit()
+    
+    def close(self):
+        """Close the underlying database connection."""
+        with self.lock:
+            self._conn.close()
@@ -0,0 +1,83 @@
+"""Persistent ETag cache for conditional HTTP requests."""
+import orjson
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+
+class ETagCache:
+    """Stores ETags and raw response bodies so unchanged resources can be revalidated with a 304."""
+    
+    def __init__(self, path: Path):
+        """Initialize ETag cache.
+        
+        Args:
+            path: JSON file used to persist the cache across runs
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        self.lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """Load cache entries from disk if present."""
+        if not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'rb') as f:
+                self._entries = orjson.loads(f.read())
+        except (OSError, ValueError):
+            # A corrupt or unreadable cache just means a cold run
+            self._entries = {}
+    
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build a cache key for a request.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Returns:
+            Cache key string
+        """
+        if not params:
+            return endpoint
+        return f"{endpoint}?{urlencode(sorted(params.items()))}"
+    
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """Get cached entry for a key.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Dictionary with 'etag' and 'body', or None if not cached
+        """
+        return self._entries.get(key)
+    
+    def set(self, key: str, etag: str, body: str):
+        """Store the ETag and raw body of a response.
+        
+        Args:
+            key: Cache key
+            etag: ETag header value
+            body: Raw response body
+        """
+        with self.lock:
+            self._entries[key] = {'etag': etag, 'body': body}
+            self._dirty = True
+    
+    def save(self):
+        """Persist cache entries to disk if they changed."""
+        with self.lock:
+            if not self._dirty:
+                return
+            
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'wb') as f:
+                f.write(orjson.dumps(self._entries))
+            self._dirty = False
@@ -0,0 +1,59 @@
+"""Bounded, thread-safe LRU cache."""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """Mapping that evicts the least recently used entries beyond a maximum size."""
+    
+    def __init__(self, maxsize: int = 4096):
+        """Initialize LRU cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Get an entry and mark it as recently used.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+        
+        Returns:
+            Cached value or default
+        """
+        with self.lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+    
+    def set(self, key: Hashable, value: Any):
+        """Store an entry, evicting the oldest ones if the cache is full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self.lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Remove all entries."""
+        with self.lock:
+            self._entries.clear()
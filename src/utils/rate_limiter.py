@@ -1,15 +1,76 @@
 """Rate limiting utility for API requests."""
+import logging
 import time
 import threading
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from functools import wraps
 from collections import deque
-from datetime import datetime, timedelta
 
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 import requests
 
 
+logger = logging.getLogger(__name__)
+
+# Wait used for a 429 that doesn't say how long to back off
+DEFAULT_RETRY_AFTER = 60.0
+
+
+def _status_code(exception: BaseException) -> Optional[int]:
+    """Get the HTTP status behind a failed request, if there was a response.
+    
+    Args:
+        exception: Exception raised by the request
+        
+    Returns:
+        HTTP status code, or None
+    """
+    status_code = getattr(exception, 'status_code', None)
+    if status_code is None:
+        response = getattr(exception, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+    return status_code
+
+
+def _retry_after_seconds(exception: Optional[BaseException]) -> Optional[float]:
+    """Get how long a rate-limited request should wait before it is retried.
+    
+    Args:
+        exception: Exception raised by the request
+        
+    Returns:
+        Seconds from the Retry-After header, or None if the request wasn't rate limited
+    """
+    if exception is None or _status_code(exception) != 429:
+        return None
+    
+    response = getattr(exception, 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    try:
+        return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _is_retryable(exception: BaseException) -> bool:
+    """Check whether a failed request is worth retrying.
+    
+    Args:
+        exception: Exception raised by the request
+        
+    Returns:
+        True for rate limits, server errors, timeouts and connection failures
+    """
+    status_code = _status_code(exception)
+    if status_code is not None:
+        # Other client errors would fail the same way again
+        return status_code == 429 or status_code >= 500
+    
+    # Network failures surface as API errors without a status, raised from the requests exception
+    cause = exception if isinstance(exception, requests.exceptions.RequestException) else exception.__context__
+    return isinstance(cause, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
 class RateLimiter:
     """Rate limiter that enforces requests per minute limits."""
     
@@ -21,28 +82,75 @@ class RateLimiter:
         """
         self.requests_per_minute = requests_per_minute
         self.min_interval = 60.0 / requests_per_minute  # Minimum seconds between requests
-        self.request_times = deque()
+        # Monotonic timestamps of the requests made in the last minute
+        self.request_times = deque(maxlen=requests_per_minute)
         self.lock = threading.Lock()
     
     def wait_if_needed(self):
-        """Wait if necessary to respect rate limits."""
-        with self.lock:
-            now = datetime.now()
-            
-            # Remove requests older than 1 minute
-            while self.request_times and now - self.request_times[0] > timedelta(minutes=1):
-                self.request_times.popleft()
-            
-            # If we're at the limit, wait until we can make another request
-            if len(self.request_times) >= self.requests_per_minute:
-                sleep_time = (self.request_times[0] + timedelta(minutes=1) - now).total_seconds()
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-                    # Remove the old request after waiting
+        """Wait if necessary to respect rate limits.
+        
+        The lock is only held to inspect and record the window, so callers that still
+        have budget aren't queued behind one that is sleeping.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                
+                # Remove requests older than 1 minute
+                while self.request_times and now - self.request_times[0] > 60.0:
                     self.request_times.popleft()
+                
+                # Record this request if there is room in the window
+                if len(self.request_times) < self.requests_per_minute:
+                    self.request_times.append(now)
+                    return
+                
+                # Otherwise wait until the oldest request leaves the window
+                sleep_time = self.request_times[0] + 60.0 - now
             
-            # Record this request
-            self.request_times.append(now)
+            time.sleep(max(sleep_time, 0))
+
+
+class TokenBucketLimiter:
+    """Rate limiter that refills a small bucket of request tokens at a steady rate.
+    
+    Checking a slot is a few float operations instead of maintaining a window of
+    timestamps, and requests are spread evenly over the minute rather than in bursts.
+    """
+    
+    def __init__(self, requests_per_minute: int = 700, burst: Optional[int] = None):
+        """Initialize token bucket limiter.
+        
+        Args:
+            requests_per_minute: Maximum number of requests per minute
+            burst: Requests allowed back to back (defaults to one second's worth, so any
+                minute stays within about 2% of the limit)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.rate = requests_per_minute / 60.0  # Tokens added per second
+        self.capacity = float(burst if burst is not None else max(1, requests_per_minute // 60))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def wait_if_needed(self):
+        """Wait if necessary to respect rate limits.
+        
+        A caller without a token reserves the next one (the balance goes negative) and
+        sleeps outside the lock until it is due, so concurrent callers queue in order.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return
+            
+            # Time until the reserved token is refilled
+            sleep_time = -self.tokens / self.rate
+        
+        time.sleep(sleep_time)
 
 
 class APIRateLimiter:
@@ -56,9 +164,18 @@ class APIRateLimiter:
             retry_attempts: Number of retry attempts for failed requests
             backoff_factor: Exponential backoff factor
         """
-        self.rate_limiter = RateLimiter(requests_per_minute)
+        self.rate_limiter = TokenBucketLimiter(requests_per_minute)
         self.retry_attempts = retry_attempts
         self.backoff_factor = backoff_factor
+        # Jitter keeps workers that failed together from retrying in lockstep
+        self._backoff = wait_exponential_jitter(initial=4, max=10, jitter=2)
+        # Retry policy shared by every function this limiter decorates
+        self._retry = retry(
+            stop=stop_after_attempt(retry_attempts),
+            wait=self._wait_before_retry,
+            retry=retry_if_exception(_is_retryable),
+            reraise=True
+        )
     
     def __call__(self, func: Callable) -> Callable:
         """Decorator to apply rate limiting and retry logic to functions.
@@ -70,36 +187,33 @@ class APIRateLimiter:
             Decorated function with rate limiting and retry logic
         """
         @wraps(func)
-        @retry(
-            stop=stop_after_attempt(self.retry_attempts),
-            wait=wait_exponential(multiplier=1, min=4, max=10),
-            retry=retry_if_exception_type((
-                requests.exceptions.RequestException,
-                requests.exceptions.HTTPError,
-                requests.exceptions.ConnectionError,
-                requests.exceptions.Timeout
-            ))
-        )
+        @self._retry
         def wrapper(*args, **kwargs) -> Any:
-            # Check if this is a rate limit error (429)
-            try:
-                result = func(*args, **kwargs)
-                # If we get a response object, check for rate limiting
-                if hasattr(result, 'status_code') and result.status_code == 429:
-                    retry_after = int(result.headers.get('Retry-After', 60))
-                    print(f"Rate limit exceeded. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    raise requests.exceptions.HTTPError("Rate limit exceeded", response=result)
-                return result
-            except requests.exceptions.HTTPError as e:
-                if hasattr(e, 'response') and e.response.status_code == 429:
-                    retry_after = int(e.response.headers.get('Retry-After', 60))
-                    print(f"Rate limit exceeded. Waiting {retry_after} seconds...")
-                    time.sleep(retry_after)
-                raise
+            # Wait for a free slot in the requests-per-minute window
+            self.rate_limiter.wait_if_needed()
+            return func(*args, **kwargs)
         
         return wrapper
     
+    def _wait_before_retry(self, retry_state: RetryCallState) -> float:
+        """Get the delay before the next attempt.
+        
+        A rate-limited request waits as long as Zendesk's Retry-After asks for,
+        anything else backs off exponentially with random jitter.
+        
+        Args:
+            retry_state: State of the call being retried
+            
+        Returns:
+            Seconds to wait
+        """
+        retry_after = _retry_after_seconds(retry_state.outcome.exception())
+        if retry_after is not None:
+            logger.warning("Rate limit exceeded, waiting %ss", retry_after)
+            return retry_after
+        
+        return self._backoff(retry_state)
+    
     def limit_request(self, func: Callable) -> Callable:
         """Apply only rate limiting without retry logic.
         
@@ -1,16 +1,74 @@
 """Zendesk API client with authentication and error handling."""
 import base64
+import socket
 import requests
-from typing import Dict, Any, List, Optional, Iterator, Tuple
-from urllib.parse import urljoin, urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple, Union
+from urllib.parse import urlparse, parse_qs
 import time
-import json
+import orjson
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from src.utils.config import config
+from src.utils.http_cache import ETagCache
 from src.utils.rate_limiter import rate_limited_request
 
 
+# Maximum number of IDs accepted by Zendesk's show_many endpoints
+SHOW_MANY_BATCH_SIZE = 100
+
+# Page size requested from cursor-paginated endpoints (Zendesk's maximum)
+CURSOR_PAGE_SIZE = 100
+
+# Keep-alive connections kept open to the Zendesk host
+CONNECTION_POOL_SIZE = 32
+
+# Below this many requests left in the rate-limit window, spread the rest over the time to reset
+LOW_RATE_LIMIT_REMAINING = 10
+LOW_RATE_LIMIT_FRACTION = 0.1
+
+# Seconds to wait for a connection and then between bytes of the response, so a stalled request fails
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Statuses returned to the caller as-is (304 only comes back for conditional requests)
+SUCCESS_STATUS_CODES = frozenset((200, 201, 204, 304))
+
+
+@lru_cache(maxsize=256)
+def _data_key(endpoint: str) -> str:
+    """Get the response key an endpoint lists its items under.
+    
+    Zendesk names it after the last path segment, e.g. 'articles' for
+    '/help_center/articles.json' and 'users' for '/organizations/1/users.json'.
+    
+    Args:
+        endpoint: API endpoint
+        
+    Returns:
+        Expected data key
+    """
+    return endpoint.rsplit('/', 1)[-1].split('.', 1)[0]
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections send TCP keep-alive probes.
+    
+    Idle connections kept between pages aren't silently dropped by NAT or load
+    balancers, so they don't have to be re-established (with a new TLS handshake).
+    """
+    
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with keep-alive on top of urllib3's TCP_NODELAY default."""
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class ZendeskAPIError(Exception):
     """Custom exception for Zendesk API errors."""
     
@@ -29,16 +87,35 @@ class ZendeskClient:
         rate_config = config.get_rate_limit_config()
         
         self.base_url = zendesk_config['base_url']
+        # Endpoints start with '/', so request URLs are a plain concatenation
+        self._base = self.base_url.rstrip('/')
         # Correct Zendesk API token authentication format: email/token:api_token
         apiKey = base64.b64encode(f"{zendesk_config['email']}/token:{zendesk_config['api_token']}".encode('utf-8')).decode('utf-8')
+        # GETs carry no body, so no Content-Type; requests sets it for JSON payloads
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization':f'Basic {apiKey}',
-            'Content-Type': 'application/json',
             'Accept': 'application/json',
             'User-Agent': 'ZendeskScraper/1.0'
         })
         
+        # Upper bound on requests issued in parallel by concurrent helpers
+        self.max_concurrent_requests = rate_config['max_concurrent_requests']
+        
+        # Size the pool so concurrent requests reuse keep-alive connections instead of reconnecting.
+        # Retries are left to the rate limiter, so every attempt waits for a token and honours Retry-After.
+        # With pool_block, a burst of threads waits for a pooled connection instead of opening
+        # extra ones that are closed (and renegotiate TLS) after a single request
+        adapter = KeepAliveAdapter(pool_connections=1,
+                                  pool_maxsize=max(CONNECTION_POOL_SIZE, self.max_concurrent_requests),
+                                  pool_block=True)
+        self.session.mount('https://', adapter)
+        
+        # ETag cache for conditional requests, loaded on first use
+        self.etag_cache_path = Path(config.get_cache_config()['directory']) / 'etags.json'
+        self._etag_cache = None
+        self._etag_cache_lock = threading.Lock()
+        
         # Apply rate limiting to the request method
         self._make_request = rate_limited_request(
             requests_per_minute=rate_config['requests_per_minute'],
@@ -59,99 +136,302 @@ class ZendeskClient:
         Raises:
             ZendeskAPIError: If API request fails
         """
-        url = self.base_url + endpoint
+        url = f'{self._base}{endpoint}'
         
         try:
+            kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+            # Every endpoint lives on the account's own host, so a redirect is never expected
+            kwargs.setdefault('allow_redirects', False)
             response = self.session.request(method, url, **kwargs)
+            self._throttle_if_near_limit(response)
             
-            # Handle different HTTP status codes
-            if response.status_code == 200:
+            # Successful and not-modified responses skip the error handling entirely
+            if response.status_code in SUCCESS_STATUS_CODES:
                 return response
-            elif response.status_code == 201:
-                return response
-            elif response.status_code == 204:
-                return response
-            elif response.status_code == 401:
-                raise ZendeskAPIError("Authentication failed. Check your API credentials.", 401, response)
-            elif response.status_code == 403:
-                raise ZendeskAPIError("Access forbidden. Check your permissions.", 403, response)
-            elif response.status_code == 404:
-                raise ZendeskAPIError(f"Resource not found: {endpoint}", 404, response)
-            elif response.status_code == 429:
-                # Rate limit - should be handled by retry logic
-                retry_after = int(response.headers.get('Retry-After', 60))
-                raise ZendeskAPIError(f"Rate limit exceeded. Retry after {retry_after} seconds.", 429, response)
-            elif response.status_code >= 500:
-                raise ZendeskAPIError(f"Server error: {response.status_code}", response.status_code, response)
-            else:
-                raise ZendeskAPIError(f"Unexpected status code: {response.status_code}", response.status_code, response)
-                
+            self._handle_error(response, endpoint)
+            
         except requests.exceptions.RequestException as e:
             raise ZendeskAPIError(f"Request failed: {str(e)}")
     
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _handle_error(self, response: requests.Response, endpoint: str):
+        """Raise the API error matching an unsuccessful response.
+        
+        Args:
+            response: Response with an error status
+            endpoint: API endpoint that was requested
+            
+        Raises:
+            ZendeskAPIError: Always
+        """
+        status_code = response.status_code
+        if status_code == 401:
+            raise ZendeskAPIError("Authentication failed. Check your API credentials.", 401, response)
+        elif status_code == 403:
+            raise ZendeskAPIError("Access forbidden. Check your permissions.", 403, response)
+        elif status_code == 404:
+            raise ZendeskAPIError(f"Resource not found: {endpoint}", 404, response)
+        elif status_code == 429:
+            # Rate limit - should be handled by retry logic
+            retry_after = int(response.headers.get('Retry-After', 60))
+            raise ZendeskAPIError(f"Rate limit exceeded. Retry after {retry_after} seconds.", 429, response)
+        elif status_code >= 500:
+            raise ZendeskAPIError(f"Server error: {status_code}", status_code, response)
+        else:
+            raise ZendeskAPIError(f"Unexpected status code: {status_code}", status_code, response)
+    
+    def _throttle_if_near_limit(self, response: requests.Response):
+        """Slow down only when Zendesk reports the rate-limit budget is almost spent.
+        
+        Args:
+            response: Response carrying Zendesk's rate-limit headers
+        """
+        headers = response.headers
+        remaining = headers.get('X-Rate-Limit-Remaining')
+        reset = headers.get('ratelimit-reset')
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+            limit = int(headers.get('X-Rate-Limit', 0))
+        except ValueError:
+            return
+        
+        # Scale the threshold with the plan's limit, so large plans slow down early enough
+        threshold = max(LOW_RATE_LIMIT_REMAINING, int(limit * LOW_RATE_LIMIT_FRACTION))
+        if remaining < threshold and reset > 0:
+            time.sleep(reset / (remaining + 1))
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            conditional: bool = False) -> Dict[str, Any]:
         """Make GET request to Zendesk API.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            conditional: Revalidate with If-None-Match and reuse the cached body on 304
             
         Returns:
             JSON response data
         """
-        response = self._make_request('GET', endpoint, params=params)
+        if not conditional:
+            response = self._make_request('GET', endpoint, params=params)
+            return self._parse_json(response.content)
+        
+        etag_cache = self._get_etag_cache()
+        cache_key = etag_cache.make_key(endpoint, params)
+        cached = etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached['etag']} if cached else None
         
+        response = self._make_request('GET', endpoint, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            return self._parse_json(cached['body'])
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_cache.set(cache_key, etag, response.content.decode('utf-8'))
+        
+        return self._parse_json(response.content)
+    
+    def _parse_json(self, body: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse a JSON response body.
+        
+        Args:
+            body: Raw response body
+            
+        Returns:
+            JSON response data
+            
+        Raises:
+            ZendeskAPIError: If the body is not valid JSON
+        """
         try:
-            return response.json()
-        except json.JSONDecodeError:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
             raise ZendeskAPIError("Invalid JSON response from API")
     
-    def get_paginated(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    def _get_etag_cache(self) -> ETagCache:
+        """Get the ETag cache, loading it from disk on first use.
+        
+        Returns:
+            ETag cache instance
+        """
+        with self._etag_cache_lock:
+            if self._etag_cache is None:
+                self._etag_cache = ETagCache(self.etag_cache_path)
+            return self._etag_cache
+    
+    def save_cache(self):
+        """Persist the ETag cache so the next run can issue conditional requests."""
+        if self._etag_cache is not None:
+            self._etag_cache.save()
+    
+    def get_paginated(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      conditional: bool = False, paginate: str = 'offset') -> Iterator[Dict[str, Any]]:
         """Get all pages of results from a paginated endpoint.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            conditional: Use conditional requests for each page
+            paginate: 'offset' to follow next_page links, 'cursor' for cursor-based pagination
             
         Yields:
             Individual items from all pages
         """
-        url = endpoint
-        request_params = params or {}
-        
-        while url:
-            # Extract endpoint from full URL if needed
-            if url.startswith('http'):
-                parsed_url = urlparse(url)
-                endpoint_path = parsed_url.path
-                # Remove API base path
-                if endpoint_path.startswith('/api/v2'):
-                    endpoint_path = endpoint_path[7:]
+        data_key = _data_key(endpoint)
+        for page_data in self.get_pages(endpoint, params, conditional, paginate):
+            yield from self._extract_items(page_data, data_key)
+    
+    def get_pages(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                  conditional: bool = False, paginate: str = 'offset') -> Iterator[Dict[str, Any]]:
+        """Get the raw responses of every page of a paginated endpoint.
+        
+        Cursor-based pagination has no deep-page limits or slowdowns, so prefer it
+        for endpoints that support it.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            conditional: Use conditional requests for each page
+            paginate: 'offset' to follow next_page links, 'cursor' for cursor-based pagination
+            
+        Yields:
+            JSON response data for each page, including any sideloaded records
+        """
+        request_params = dict(params or {})
+        if paginate == 'cursor':
+            request_params.setdefault('page[size]', CURSOR_PAGE_SIZE)
+        else:
+            page = int(request_params.get('page', 1))
+        
+        # One page of lookahead: the next page loads while the caller processes this one
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            response_data = self._get_page(endpoint, request_params, conditional)
+            while response_data is not None:
+                # Get next page URL
+                url, next_params = None, {}
+                if paginate == 'cursor':
+                    meta = response_data.get('meta', {})
+                    cursor = meta.get('after_cursor') if meta.get('has_more') else None
+                    if cursor:
+                        # Same endpoint and params plus the cursor, so there's no URL to parse
+                        url, next_params = endpoint, {**request_params, 'page[after]': cursor}
+                    elif meta.get('has_more'):
+                        url = response_data.get('links', {}).get('next')
+                elif response_data.get('next_page'):
+                    if endpoint.startswith('http'):
+                        # A full URL carries its own params, so only next_page can move it on
+                        url = response_data['next_page']
+                    else:
+                        # next_page is the same request one page on, so build it instead of parsing the URL
+                        page += 1
+                        url, next_params = endpoint, {**request_params, 'page': page}
                 
-                # Parse query parameters from URL
-                url_params = parse_qs(parsed_url.query)
-                # Convert list values to single values
-                url_params = {k: v[0] if isinstance(v, list) and len(v) == 1 else v 
-                             for k, v in url_params.items()}
+                next_page = executor.submit(self._get_page, url, next_params, conditional) if url else None
                 
-                response_data = self.get(endpoint_path, url_params)
-            else:
-                response_data = self.get(url, request_params)
+                yield response_data
+                
+                response_data = next_page.result() if next_page else None
+    
+    def _get_page(self, url: str, params: Dict[str, Any], conditional: bool) -> Dict[str, Any]:
+        """Get one page of a paginated endpoint.
+        
+        Args:
+            url: API endpoint, or a full next-page URL returned by Zendesk
+            params: Query parameters (ignored for full URLs, which carry their own)
+            conditional: Use a conditional request
             
-            # Determine the key that contains the list of items
-            data_key = None
-            for key in response_data.keys():
-                if isinstance(response_data[key], list) and key != 'next_page':
-                    data_key = key
-                    break
+        Returns:
+            JSON response data
+        """
+        # Extract endpoint from full URL if needed
+        if url.startswith('http'):
+            parsed_url = urlparse(url)
+            endpoint_path = parsed_url.path
+            # Remove API base path
+            if endpoint_path.startswith('/api/v2'):
+                endpoint_path = endpoint_path[7:]
             
-            if data_key:
-                for item in response_data[data_key]:
-                    yield item
+            # Parse query parameters from URL
+            url_params = parse_qs(parsed_url.query)
+            # Convert list values to single values
+            url_params = {k: v[0] if isinstance(v, list) and len(v) == 1 else v 
+                         for k, v in url_params.items()}
             
-            # Get next page URL
-            url = response_data.get('next_page')
-            request_params = {}  # Clear params for subsequent requests as they're in the URL
+            return self.get(endpoint_path, url_params, conditional)
+        
+        return self.get(url, params, conditional)
+    
+    def get_paginated_concurrent(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                                 conditional: bool = False) -> Iterator[Dict[str, Any]]:
+        """Get all pages of an offset-paginated endpoint, fetching pages in parallel.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            conditional: Use conditional requests for each page
+            
+        Yields:
+            Individual items from all pages
+        """
+        data_key = _data_key(endpoint)
+        for page_data in self.get_pages_concurrent(endpoint, params, conditional):
+            yield from self._extract_items(page_data, data_key)
+    
+    def get_pages_concurrent(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                             conditional: bool = False) -> Iterator[Dict[str, Any]]:
+        """Get the raw responses of every page of an offset-paginated endpoint in parallel.
+        
+        The first page is fetched to learn the page count, then the remaining
+        pages are requested concurrently and yielded in page order.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            conditional: Use conditional requests for each page
+            
+        Yields:
+            JSON response data for each page, including any sideloaded records
+        """
+        request_params = dict(params or {})
+        first_page = self.get(endpoint, request_params, conditional)
+        yield first_page
+        
+        page_count = first_page.get('page_count')
+        if not page_count:
+            # Endpoint doesn't report a page count, follow next_page links instead
+            if first_page.get('next_page'):
+                yield from self.get_pages(endpoint, {**request_params, 'page': 2}, conditional)
+            return
+        
+        def fetch_page(page: int) -> Dict[str, Any]:
+            return self.get(endpoint, {**request_params, 'page': page}, conditional)
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            yield from executor.map(fetch_page, range(2, page_count + 1))
+    
+    def _extract_items(self, response_data: Dict[str, Any], data_key: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the list of items from a paginated response.
+        
+        Args:
+            response_data: JSON response data
+            data_key: Key expected to hold the items (see _data_key)
+            
+        Returns:
+            Items contained in the response
+        """
+        items = response_data.get(data_key)
+        if isinstance(items, list):
+            return items
+        
+        # Otherwise determine the key that contains the list of items
+        for key, value in response_data.items():
+            if isinstance(value, list) and key != 'next_page':
+                return value
+        
+        return []
     
     def get_all(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Get all items from a paginated endpoint.
@@ -165,6 +445,35 @@ class ZendeskClient:
         """
         return list(self.get_paginated(endpoint, params))
     
+    def get_many(self, endpoint: str, data_key: str, ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Get resources by ID from a show_many endpoint in batches.
+        
+        Args:
+            endpoint: show_many endpoint (e.g., '/users/show_many.json')
+            data_key: Response key containing the list of items
+            ids: IDs of the resources to fetch
+            
+        Returns:
+            List of all items returned
+        """
+        ids = list(ids)
+        chunks = [ids[start:start + SHOW_MANY_BATCH_SIZE] for start in range(0, len(ids), SHOW_MANY_BATCH_SIZE)]
+        
+        def fetch_chunk(chunk: List[int]) -> List[Dict[str, Any]]:
+            response = self.get(endpoint, {'ids': ','.join(str(item_id) for item_id in chunk)})
+            return response.get(data_key, [])
+        
+        if len(chunks) <= 1:
+            return fetch_chunk(chunks[0]) if chunks else []
+        
+        # Batches are independent, so they are requested in parallel (results keep ID order)
+        items = []
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrent_requests, len(chunks))) as executor:
+            for chunk_items in executor.map(fetch_chunk, chunks):
+                items.extend(chunk_items)
+        
+        return items
+    
     def test_connection(self) -> Tuple[bool, str]:
         """Test the API connection and authentication.
         
@@ -183,13 +492,29 @@ class ZendeskClient:
     def get_tickets(self, **params) -> Iterator[Dict[str, Any]]:
         """Get all tickets.
         
+        Cursor pagination has no cap on how deep it can page, unlike offset pagination.
+        
         Args:
             **params: Query parameters (e.g., status, created_after)
             
         Yields:
             Ticket objects
         """
-        return self.get_paginated('/tickets.json', params)
+        return self.get_paginated('/tickets.json', params, paginate='cursor')
+    
+    def get_ticket_pages(self, include: Optional[str] = None, **params) -> Iterator[Dict[str, Any]]:
+        """Get all ticket pages with optional sideloads.
+        
+        Args:
+            include: Comma-separated sideloads (e.g., 'users,organizations,groups')
+            **params: Query parameters (e.g., status, created_after)
+            
+        Yields:
+            Page responses with 'tickets' and any sideloaded lists
+        """
+        if include:
+            params['include'] = include
+        return self.get_pages('/tickets.json', params, paginate='cursor')
     
     def get_ticket_comments(self, ticket_id: int) -> List[Dict[str, Any]]:
         """Get comments for a specific ticket.
@@ -203,49 +528,84 @@ class ZendeskClient:
         response = self.get(f'/tickets/{ticket_id}/comments.json')
         return response.get('comments', [])
     
+    def get_ticket_fields(self) -> Iterator[Dict[str, Any]]:
+        """Get all ticket field definitions.
+        
+        Yields:
+            Ticket field objects
+        """
+        return self.get_paginated('/ticket_fields.json')
+    
     def get_users(self, **params) -> Iterator[Dict[str, Any]]:
         """Get all users.
         
+        Cursor pagination has no cap on how deep it can page, unlike offset pagination.
+        
         Args:
             **params: Query parameters
             
         Yields:
             User objects
         """
-        return self.get_paginated('/users.json', params)
+        return self.get_paginated('/users.json', params, paginate='cursor')
+    
+    def get_users_by_ids(self, user_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Get multiple users by ID.
+        
+        Args:
+            user_ids: User IDs
+            
+        Returns:
+            List of user objects (unknown IDs are omitted)
+        """
+        return self.get_many('/users/show_many.json', 'users', user_ids)
     
-    def get_organizations(self, **params) -> Iterator[Dict[str, Any]]:
+    def get_organizations(self, paginate: str = 'offset', **params) -> Iterator[Dict[str, Any]]:
         """Get all organizations.
         
         Args:
+            paginate: Pagination style ('offset' or 'cursor')
             **params: Query parameters
             
         Yields:
             Organization objects
         """
-        return self.get_paginated('/organizations.json', params)
+        return self.get_paginated('/organizations.json', params, paginate=paginate)
     
-    def get_groups(self, **params) -> Iterator[Dict[str, Any]]:
+    def get_groups(self, paginate: str = 'offset', **params) -> Iterator[Dict[str, Any]]:
         """Get all groups.
         
         Args:
+            paginate: Pagination style ('offset' or 'cursor')
             **params: Query parameters
             
         Yields:
             Group objects
         """
-        return self.get_paginated('/groups.json', params)
+        return self.get_paginated('/groups.json', params, paginate=paginate)
     
-    def get_macros(self, **params) -> Iterator[Dict[str, Any]]:
+    def get_deleted_groups(self, **params) -> Iterator[Dict[str, Any]]:
+        """Get all deleted groups.
+        
+        Args:
+            **params: Query parameters
+            
+        Yields:
+            Deleted group objects
+        """
+        return self.get_paginated('/deleted_groups.json', params)
+    
+    def get_macros(self, paginate: str = 'offset', **params) -> Iterator[Dict[str, Any]]:
         """Get all macros.
         
         Args:
+            paginate: Pagination style ('offset' or 'cursor')
             **params: Query parameters
             
         Yields:
             Macro objects
         """
-        return self.get_paginated('/macros.json', params)
+        return self.get_paginated('/macros.json', params, paginate=paginate)
     
     def get_help_center_articles(self, **params) -> Iterator[Dict[str, Any]]:
         """Get all Help Center articles.
@@ -256,7 +616,21 @@ class ZendeskClient:
         Yields:
             Article objects
         """
-        return self.get_paginated('/help_center/articles.json', params)
+        return self.get_paginated_concurrent('/help_center/articles.json', params, conditional=True)
+    
+    def get_help_center_article_pages(self, include: Optional[str] = None, **params) -> Iterator[Dict[str, Any]]:
+        """Get all Help Center article pages with optional sideloads.
+        
+        Args:
+            include: Comma-separated sideloads (e.g., 'users,sections,categories')
+            **params: Query parameters
+            
+        Yields:
+            Page responses with 'articles' and any sideloaded lists
+        """
+        if include:
+            params['include'] = include
+        return self.get_pages_concurrent('/help_center/articles.json', params, conditional=True)
     
     def get_help_center_sections(self, **params) -> Iterator[Dict[str, Any]]:
         """Get all Help Center sections.
@@ -267,7 +641,7 @@ class ZendeskClient:
         Yields:
             Section objects
         """
-        return self.get_paginated('/help_center/sections.json', params)
+        return self.get_paginated_concurrent('/help_center/sections.json', params, conditional=True)
     
     def get_help_center_categories(self, **params) -> Iterator[Dict[str, Any]]:
         """Get all Help Center categories.
@@ -278,4 +652,16 @@ class ZendeskClient:
         Yields:
             Category objects
         """
-        return self.get_paginated('/help_center/categories.json', params) 
\ No newline at end of file
+        return self.get_paginated_concurrent('/help_center/categories.json', params, conditional=True)
+
+
+@lru_cache(maxsize=None)
+def get_client() -> ZendeskClient:
+    """Get the shared Zendesk client.
+    
+    Collectors share one client so they share its connection pool and caches.
+    
+    Returns:
+        Process-wide ZendeskClient instance
+    """
+    return ZendeskClient()
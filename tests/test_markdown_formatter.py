@@ -0,0 +1,95 @@
+"""Tests for the HTML to markdown conversion."""
+import html
+import random
+import re
+import unittest
+
+from src.exporters.markdown_formatter import MarkdownFormatter, _HTML_TO_MARKDOWN_RULES
+
+
+def convert_sequentially(html_content: str) -> str:
+    """Convert HTML the original way, applying each rule as its own re.sub pass."""
+    if not html_content:
+        return ""
+    
+    content = html.unescape(html_content)
+    for pattern, replacement in _HTML_TO_MARKDOWN_RULES:
+        content = re.sub(pattern, replacement, content, flags=re.IGNORECASE | re.MULTILINE)
+    content = re.sub(r'\n\s*\n\s*\n', '\n\n', content)
+    content = re.sub(r'[ \t]+', ' ', content)
+    return content.strip()
+
+
+# Tags prefixed by another rule's tag name (<br>, <img>, <blockquote>) end their line,
+# as they do in practice; on a single line the sequential passes mangle them anyway
+TAGS = ['h1', 'h3', 'strong', 'b', 'em', 'i', 'code', 'ul', 'ol', 'li', 'p', 'div', 'a',
+        'span', 'blockquote', 'br', 'img']
+WORDS = ['x', 'hello', 'a &amp; b', '  ', '\n', 'y z', '\n\n']
+
+
+def random_body(rng: random.Random, depth: int, used: tuple = ()) -> str:
+    """Build a random multi-line body, never nesting a tag inside itself."""
+    if depth == 0 or rng.random() < 0.3:
+        return rng.choice(WORDS)
+    
+    tag = rng.choice([tag for tag in TAGS if tag not in used] or ['p'])
+    inner = ''.join(random_body(rng, depth - 1, used + (tag,)) for _ in range(rng.randint(1, 3)))
+    if tag == 'br':
+        return '<br>\n' + inner
+    if tag == 'img':
+        return '<img src="a.png">\n' + inner
+    if tag == 'blockquote':
+        return f'<blockquote>\n{inner}\n</blockquote>'
+    if tag == 'a':
+        return f'<a href="https://example.com/{rng.randint(0, 9)}">{inner}</a>'
+    return f'<{tag} class="c">{inner}</{tag}>'
+
+
+class HtmlToMarkdownTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.formatter = MarkdownFormatter('tickets')
+    
+    def test_tags_do_not_match_across_lines(self):
+        self.assertEqual(self.formatter._format_html_to_markdown('<p>Line one<br>\nLine two <b>bold</b></p>'),
+                         'Line one\n\nLine two **bold**')
+        self.assertEqual(self.formatter._format_html_to_markdown('<p><img src="a.png">\nSee <i>note</i></p>'),
+                         'See *note*')
+    
+    def test_nested_inline_tags(self):
+        body = '<blockquote>\n<p>Quoted <strong>bold <em>and italic</em></strong> text</p>\n</blockquote>'
+        self.assertEqual(self.formatter._format_html_to_markdown(body), convert_sequentially(body))
+        self.assertEqual(self.formatter._format_html_to_markdown(body), 'Quoted **bold *and italic*** text')
+    
+    def test_same_tag_nesting(self):
+        for body in ['<ul><li>a<ul><li>b</li><li>c</li></ul></li><li>d</li></ul>',
+                     '<li><code><li>x</li></code></li>',
+                     '<strong><h3><strong>x</strong></h3></strong>']:
+            self.assertEqual(self.formatter._format_html_to_markdown(body), convert_sequentially(body), body)
+    
+    def test_matches_sequential_conversion_on_tag_soup(self):
+        rng = random.Random(3)
+        tags = TAGS + ['abbr', 'pre']
+        for _ in range(2000):
+            tokens = []
+            for _ in range(rng.randint(1, 14)):
+                tag = rng.choice(tags)
+                roll = rng.random()
+                if roll < 0.4:
+                    tokens.append(rng.choice(WORDS))
+                elif roll < 0.7:
+                    tokens.append(f'<a href="https://example.com/{rng.randint(0, 3)}">' if tag == 'a' else f'<{tag} class="c">')
+                else:
+                    tokens.append(f'</{tag}>')
+            body = ''.join(tokens)
+            self.assertEqual(self.formatter._format_html_to_markdown(body), convert_sequentially(body), body)
+    
+    def test_matches_sequential_conversion_on_multiline_bodies(self):
+        rng = random.Random(2)
+        for _ in range(2000):
+            body = random_body(rng, 4)
+            self.assertEqual(self.formatter._format_html_to_markdown(body), convert_sequentially(body), body)
+
+
+if __name__ == '__main__':
+    unittest.main()
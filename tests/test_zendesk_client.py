@@ -0,0 +1,101 @@
+"""Tests for ZendeskClient pagination."""
+import time
+import unittest
+from typing import Any, Dict, Optional
+
+from src.zendesk_client import ZendeskClient
+
+
+class StubClient(ZendeskClient):
+    """Client that serves numbered pages from memory instead of the API."""
+    
+    def __init__(self, pages: int, page_count: bool = True):
+        self.pages = pages
+        self.page_count = page_count
+        self.max_concurrent_requests = 4
+        self.calls = []
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            conditional: bool = False) -> Dict[str, Any]:
+        params = dict(params or {})
+        self.calls.append((endpoint, params))
+        if endpoint.startswith('http'):
+            page = int(endpoint.rsplit('page=', 1)[1])
+            endpoint = endpoint.split('/api/v2', 1)[1].split('?', 1)[0]
+        else:
+            page = int(params.get('page', 1))
+        if page > self.pages:
+            raise AssertionError(f'Requested page {page} past the last page')
+        
+        response = {
+            'macros': [{'id': page}],
+            'next_page': f'https://example.zendesk.com/api/v2{endpoint}?page={page + 1}' if page < self.pages else None
+        }
+        if self.page_count:
+            response['page_count'] = self.pages
+        return response
+
+
+class PaginationTest(unittest.TestCase):
+    
+    def test_offset_pages_follow_page_numbers(self):
+        client = StubClient(3)
+        items = [item['id'] for item in client.get_paginated('/macros.json', {'active': True})]
+        
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(client.calls[-1], ('/macros.json', {'active': True, 'page': 3}))
+    
+    def test_concurrent_pages_follow_next_page_without_page_count(self):
+        client = StubClient(3, page_count=False)
+        items = [item['id'] for item in client.get_paginated_concurrent('/macros.json', {'active': True})]
+        
+        self.assertEqual(items, [1, 2, 3])
+        self.assertEqual(len(client.calls), 3)
+    
+    def test_concurrent_pages_use_page_count(self):
+        client = StubClient(4)
+        items = [item['id'] for item in client.get_paginated_concurrent('/macros.json')]
+        
+        self.assertEqual(items, [1, 2, 3, 4])
+    
+    def test_full_url_endpoint_follows_next_page_links(self):
+        client = StubClient(3)
+        pages = list(client.get_pages('https://example.zendesk.com/api/v2/macros.json?page=2'))
+        
+        self.assertEqual([page['macros'][0]['id'] for page in pages], [2, 3])
+
+
+
+class ShowManyStubClient(ZendeskClient):
+    """Client that answers show_many requests from memory, slowest for the first batch."""
+    
+    def __init__(self):
+        self.max_concurrent_requests = 4
+        self.batches = []
+    
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+            conditional: bool = False) -> Dict[str, Any]:
+        ids = [int(item_id) for item_id in params['ids'].split(',')]
+        self.batches.append(ids)
+        if ids[0] == 0:
+            time.sleep(0.05)
+        return {'users': [{'id': item_id} for item_id in ids]}
+
+
+class GetManyTest(unittest.TestCase):
+    
+    def test_batches_are_fetched_in_parallel_and_keep_id_order(self):
+        client = ShowManyStubClient()
+        users = client.get_many('/users/show_many.json', 'users', range(250))
+        
+        self.assertEqual([user['id'] for user in users], list(range(250)))
+        self.assertEqual(sorted(len(batch) for batch in client.batches), [50, 100, 100])
+    
+    def test_no_ids_makes_no_request(self):
+        client = ShowManyStubClient()
+        
+        self.assertEqual(client.get_many('/users/show_many.json', 'users', []), [])
+        self.assertEqual(client.batches, [])
+
+if __name__ == '__main__':
+    unittest.main()